@@ -1,17 +1,20 @@
 """
 Background worker for video conversion.
 """
-import sys
-from pathlib import Path
-from typing import Dict, Any
-from PyQt6.QtCore import QThread, pyqtSignal, QEventLoop
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Set
+from PyQt6.QtCore import QMetaObject, Qt, QThread, pyqtSignal, pyqtSlot
 
 from converter.ffmpeg_wrapper import FFmpegWrapper
+from utils.config import config
 from utils.logger import logger
-from utils.validators import get_output_filename
+from utils.validators import get_output_filename, prepare_conversion
+
+# Minimum interval between progress signals sent to the GUI thread (10 Hz)
+_PROGRESS_EMIT_INTERVAL_NS = 100_000_000
 
 
 class ConversionWorker(QThread):
@@ -45,11 +48,12 @@ class ConversionWorker(QThread):
         self.input_file = input_file
         self.output_file = output_file or get_output_filename(input_file)
         self._is_cancelled = False
+        self._last_emit_ns = 0
 
     def run(self):
         """Run the conversion in background thread."""
         try:
-            logger.info(f"Conversion worker started for: {self.input_file}")
+            logger.info("Conversion worker started for: %s", self.input_file)
             self.conversion_started.emit(self.input_file, self.output_file)
 
             # Run conversion with callbacks
@@ -65,7 +69,7 @@ class ConversionWorker(QThread):
                 logger.info("Conversion was cancelled")
                 self.conversion_cancelled.emit()
             elif success:
-                logger.info(f"Conversion completed: {self.output_file}")
+                logger.info("Conversion completed: %s", self.output_file)
                 self.conversion_finished.emit(self.output_file)
             else:
                 error_msg = "Conversion failed"
@@ -84,9 +88,18 @@ class ConversionWorker(QThread):
         Args:
             progress_data: Progress information dictionary
         """
-        if not self._is_cancelled:
-            logger.debug(f"Worker emitting progress: {progress_data}")
-            self.progress_updated.emit(progress_data)
+        if self._is_cancelled:
+            return
+
+        # Throttle cross-thread signals; always let the final update through
+        now = time.monotonic_ns()
+        if (now - self._last_emit_ns < _PROGRESS_EMIT_INTERVAL_NS
+                and progress_data.get('progress', 0) < 100):
+            return
+        self._last_emit_ns = now
+
+        logger.debug("Worker emitting progress: %s", progress_data)
+        self.progress_updated.emit(progress_data)
 
     def _on_error(self, error_message: str):
         """
@@ -95,7 +108,7 @@ class ConversionWorker(QThread):
         Args:
             error_message: Error message string
         """
-        logger.error(f"FFmpeg error: {error_message}")
+        logger.error("FFmpeg error: %s", error_message)
 
     def cancel(self):
         """Cancel the conversion."""
@@ -104,17 +117,35 @@ class ConversionWorker(QThread):
         self.requestInterruption()
 
 
+@dataclass
+class _BatchSlotResult:
+    """Outcome of converting one file of a batch."""
+
+    output_file: str
+    success: bool = False
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def error_message(self) -> str:
+        """FFmpeg error lines for a failed file, or a generic message."""
+        return "\n".join(self.errors) or "Conversion failed"
+
+
 class BatchConversionManager(QThread):
     """
     Manager for batch conversion of multiple files.
 
-    Processes files one at a time to avoid system overload.
+    With a software encoder files are processed one at a time to avoid
+    system overload. When a hardware encoder (NVENC or VAAPI) is in use,
+    several files are converted concurrently, up to
+    Config.MAX_CONCURRENT_HW_CONVERSIONS. Conversions run on the manager
+    thread or a thread pool it owns; no per-file worker thread is created.
 
     Signals:
         file_started: Emitted when a file starts converting (index, total, input_file)
         file_finished: Emitted when a file finishes (index, total, output_file)
         file_failed: Emitted when a file fails (index, total, input_file, error)
-        progress_updated: Emitted with progress for current file
+        progress_updated: Emitted with progress for a file (index, progress_data)
         all_finished: Emitted when all conversions complete
         batch_cancelled: Emitted when batch is cancelled
     """
@@ -127,101 +158,196 @@ class BatchConversionManager(QThread):
     all_finished = pyqtSignal()
     batch_cancelled = pyqtSignal()
 
-    def __init__(self, file_list: list):
+    def __init__(self, file_list: list, max_concurrency: Optional[int] = None):
         """
         Initialize batch conversion manager.
 
         Args:
             file_list: List of input file paths to convert
+            max_concurrency: Maximum number of simultaneous conversions.
+                             If None, chosen from the active encoder.
         """
         super().__init__()
         self.file_list = file_list
-        self.current_worker = None
+        self.max_concurrency = max_concurrency
         self._is_cancelled = False
+        self._lock = threading.Lock()
+        self._last_emit_ns: Dict[int, int] = {}
+        self._reserved_outputs: Set[str] = set()
+        # Estimated size of the outputs being written right now, counted
+        # against free space when the next file is checked (guarded by _lock)
+        self._reserved_bytes = 0
+        # Newest not-yet-delivered progress per file, and whether a flush
+        # is already queued on the GUI thread (guarded by _lock)
+        self._latest_progress: Dict[int, Dict[str, Any]] = {}
+        self._flush_pending = False
+
+    def _resolve_concurrency(self) -> int:
+        """
+        Determine how many files to convert at once.
+
+        Returns:
+            Number of concurrent conversions (at least 1)
+        """
+        if self.max_concurrency is not None:
+            limit = self.max_concurrency
+        elif config.get_video_encoder() == config.DEFAULT_VIDEO_CODEC:
+            # Software encoding saturates the CPU on its own
+            limit = 1
+        else:
+            limit = config.MAX_CONCURRENT_HW_CONVERSIONS
+
+        return max(1, min(limit, len(self.file_list)))
 
     def run(self):
         """Run batch conversion."""
         try:
             total_files = len(self.file_list)
-            logger.info(f"Starting batch conversion of {total_files} files")
-
-            for index, input_file in enumerate(self.file_list):
-                if self._is_cancelled:
-                    logger.info("Batch conversion cancelled")
-                    self.batch_cancelled.emit()
-                    return
-
-                logger.info(f"Processing file {index + 1}/{total_files}: {input_file}")
-                self.file_started.emit(index, total_files, input_file)
-
-                # Create output filename
-                output_file = get_output_filename(input_file)
-
-                # Create and run worker for this file
-                self.current_worker = ConversionWorker(input_file, output_file)
-
-                success = False
-                error_message = ""
-
-                # Define callbacks BEFORE connecting signals
-                def on_finished(output):
-                    nonlocal success
-                    success = True
-                    logger.info(f"Batch manager: File finished callback triggered for {output}")
-
-                def on_failed(inp, error):
-                    nonlocal success, error_message
-                    success = False
-                    error_message = error
-                    logger.error(f"Batch manager: File failed callback triggered: {error}")
-
-                # Connect ALL signals BEFORE starting the thread
-                self.current_worker.conversion_started.connect(
-                    lambda inp, out: None  # Already emitted file_started
-                )
-                self.current_worker.conversion_finished.connect(on_finished)
-                self.current_worker.conversion_failed.connect(on_failed)
-
-                # Progress forwarding with logging
-                def forward_progress(data, idx=index):
-                    logger.debug(f"BatchManager forwarding progress for file {idx}: {data}")
-                    self.progress_updated.emit(idx, data)
-
-                self.current_worker.progress_updated.connect(forward_progress)
-
-                # Start worker and wait for completion using event loop
-                # This allows signals to be processed while waiting
-                loop = QEventLoop()
-                self.current_worker.finished.connect(loop.quit)
-                self.current_worker.start()
-                loop.exec()  # Process events while waiting
-
-                logger.info(f"Worker thread finished for file {index + 1}/{total_files}")
-
-                if self._is_cancelled:
-                    logger.info("Batch conversion cancelled")
-                    self.batch_cancelled.emit()
-                    return
-
-                if success:
-                    self.file_finished.emit(index, total_files, output_file)
-                else:
-                    self.file_failed.emit(index, total_files, input_file, error_message)
-
-            logger.info("Batch conversion completed")
-            self.all_finished.emit()
+            concurrency = self._resolve_concurrency()
+            logger.info("Starting batch conversion of %d files (%d at a time)",
+                        total_files, concurrency)
+
+            if concurrency == 1:
+                for index, input_file in enumerate(self.file_list):
+                    if self._is_cancelled:
+                        break
+                    self._convert_one(index, total_files, input_file)
+            else:
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    futures = [
+                        executor.submit(self._convert_one, index, total_files, input_file)
+                        for index, input_file in enumerate(self.file_list)
+                    ]
+                    for future in futures:
+                        future.result()
+
+        except Exception as e:
+            logger.error("Error in batch conversion: %s", e)
+
+        # Always end with exactly one of these, even after an error, so the
+        # window leaves its converting state
+        if self._is_cancelled:
+            logger.info("Batch conversion cancelled")
+            self.batch_cancelled.emit()
+            return
+
+        logger.info("Batch conversion completed")
+        self.all_finished.emit()
 
+    def _convert_one(self, index: int, total_files: int, input_file: str):
+        """
+        Convert a single file of the batch, failing only that file on error.
+
+        Args:
+            index: Index of the file in the batch
+            total_files: Number of files in the batch
+            input_file: Path to input video file
+        """
+        try:
+            self._convert_file(index, total_files, input_file)
         except Exception as e:
-            logger.error(f"Error in batch conversion: {e}")
+            logger.error("Batch manager: Error converting %s: %s", input_file, e)
+            self.file_failed.emit(index, total_files, input_file, str(e))
+
+    def _convert_file(self, index: int, total_files: int, input_file: str):
+        """
+        Convert a single file of the batch and emit its result signals.
+
+        Args:
+            index: Index of the file in the batch
+            total_files: Number of files in the batch
+            input_file: Path to input video file
+        """
+        if self._is_cancelled:
+            return
+
+        logger.info("Processing file %d/%d: %s", index + 1, total_files, input_file)
+        self.file_started.emit(index, total_files, input_file)
+
+        # Re-check the input and pick the output in one pass over the
+        # filesystem; the name and the space it needs are reserved so
+        # concurrent files never share a name or count the same free space
+        with self._lock:
+            plan = prepare_conversion(input_file, exclude=self._reserved_outputs,
+                                      reserved_bytes=self._reserved_bytes)
+            if plan.ok:
+                self._reserved_outputs.add(plan.output_path)
+                self._reserved_bytes += plan.estimated_bytes
+            self._last_emit_ns[index] = 0
+
+        if not plan.ok:
+            logger.error("Batch manager: File failed: %s", plan.message)
+            self.file_failed.emit(index, total_files, input_file, plan.message)
+            return
+
+        output_file = plan.output_path
+        result = _BatchSlotResult(output_file)
+        try:
+            result.success = FFmpegWrapper.convert_video(
+                input_file=input_file,
+                output_file=output_file,
+                progress_callback=lambda data: self._on_progress(index, data),
+                error_callback=result.errors.append,
+                cancel_check=lambda: self._is_cancelled
+            )
+        finally:
+            # Written (or abandoned) by now, so free space already reflects it
+            with self._lock:
+                self._reserved_bytes -= plan.estimated_bytes
+
+        logger.info("Conversion finished for file %d/%d", index + 1, total_files)
+
+        if self._is_cancelled:
+            return
+
+        if result.success:
+            self.file_finished.emit(index, total_files, result.output_file)
+        else:
+            logger.error("Batch manager: File failed: %s", result.error_message)
+            self.file_failed.emit(index, total_files, input_file, result.error_message)
+
+    def _on_progress(self, index: int, progress_data: Dict[str, Any]):
+        """
+        Queue progress for a file, throttled per file like ConversionWorker.
+
+        Updates are not emitted from the conversion thread. The newest one
+        per file is stored, and at most one _flush_progress call is queued
+        on the GUI thread at a time, so a busy GUI never builds a backlog.
+
+        Args:
+            index: Index of the file being converted
+            progress_data: Progress information dictionary
+        """
+        now = time.monotonic_ns()
+        with self._lock:
+            if (now - self._last_emit_ns.get(index, 0) < _PROGRESS_EMIT_INTERVAL_NS
+                    and progress_data.get('progress', 0) < 100):
+                return
+            self._last_emit_ns[index] = now
+
+            self._latest_progress[index] = progress_data
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+
+        QMetaObject.invokeMethod(self, "_flush_progress", Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot()
+    def _flush_progress(self):
+        """Emit the newest queued progress for each file (runs on the GUI thread)."""
+        with self._lock:
+            latest = self._latest_progress
+            self._latest_progress = {}
+            self._flush_pending = False
+
+        for index, progress_data in sorted(latest.items()):
+            logger.debug("BatchManager forwarding progress for file %d: %s", index, progress_data)
+            self.progress_updated.emit(index, progress_data)
 
     def cancel(self):
         """Cancel the batch conversion."""
         logger.info("Cancelling batch conversion...")
+        # Picked up by every running convert_video's cancel_check, which
+        # terminates its FFmpeg process; queued files are skipped
         self._is_cancelled = True
-
-        # Cancel current worker if running
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.cancel()
-            self.current_worker.wait()
-
         self.requestInterruption()
@@ -1,69 +1,264 @@
 """
 FFmpeg wrapper for video conversion and analysis.
 """
-import subprocess
-import json
+import functools
+import os
 import re
-import threading
-from typing import Dict, Any, Callable, Optional
-from pathlib import Path
+import queue
+import selectors
+import subprocess
 import sys
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import threading
+import json
+from collections import deque
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple
 
 from utils.config import config
 from utils.logger import logger
 
+# orjson is an optional, faster drop-in for parsing ffprobe output
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# How long to block waiting for FFmpeg output before re-checking cancellation
+_SELECT_TIMEOUT = 0.1
+_READ_CHUNK_SIZE = 65536
+_STDERR_TAIL_LINES = 50
+
+# Input duration as printed by FFmpeg, e.g. "  Duration: 00:01:23.45, start: ..."
+_DURATION_RE = re.compile(rb'Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)')
+# FFmpeg stderr lines reported through error_callback: any line containing
+# "error" or "failed" in any case (matched on raw bytes)
+_ERROR_RE = re.compile(rb'(?i)error|failed')
+
+
+def _iter_output_lines(process: subprocess.Popen) -> Iterator[Optional[Tuple[int, bytes]]]:
+    """
+    Yield (stream_index, line) for the non-empty lines FFmpeg writes.
+
+    stream_index is 0 for stdout and 1 for stderr. None is yielded at least
+    every _SELECT_TIMEOUT seconds while FFmpeg is silent, so the caller can
+    poll for cancellation. Ends once both pipes reach EOF.
+    """
+    streams = (process.stdout, process.stderr)
+
+    if sys.platform == 'win32':
+        # select() only accepts sockets on Windows; drain each pipe on a thread
+        lines = queue.Queue()
+
+        def drain(stream_index, stream):
+            for line in stream:
+                lines.put((stream_index, line))
+            lines.put((stream_index, None))
+
+        for stream_index, stream in enumerate(streams):
+            threading.Thread(target=drain, args=(stream_index, stream), daemon=True).start()
+
+        open_streams = len(streams)
+        while open_streams:
+            try:
+                stream_index, line = lines.get(timeout=_SELECT_TIMEOUT)
+            except queue.Empty:
+                yield None
+                continue
+
+            if line is None:
+                open_streams -= 1
+                continue
+            line = line.strip()
+            if line:
+                yield stream_index, line
+        return
+
+    with selectors.DefaultSelector() as selector:
+        partial_lines = {}
+        for stream_index, stream in enumerate(streams):
+            fd = stream.fileno()
+            os.set_blocking(fd, False)
+            selector.register(fd, selectors.EVENT_READ, stream_index)
+            partial_lines[fd] = b''
+
+        while selector.get_map():
+            events = selector.select(timeout=_SELECT_TIMEOUT)
+            yield None
+
+            for key, _ in events:
+                try:
+                    chunk = os.read(key.fd, _READ_CHUNK_SIZE)
+                except BlockingIOError:
+                    continue
+
+                if chunk:
+                    buffered = partial_lines[key.fd] + chunk
+                    *complete, partial_lines[key.fd] = buffered.split(b'\n')
+                else:
+                    # EOF: flush any unterminated last line
+                    selector.unregister(key.fd)
+                    complete = [partial_lines.pop(key.fd)]
+
+                for line in complete:
+                    line = line.strip()
+                    if line:
+                        yield key.data, line
+
+
+def _parse_out_time(value: bytes) -> Dict[str, Any]:
+    """Parse out_time_ms (despite the name, FFmpeg reports microseconds)."""
+    current_time = int(value) / 1000000.0
+    return {
+        'time': current_time,
+        'time_formatted': FFmpegWrapper._format_time(current_time)
+    }
+
+
+def _parse_speed(value: bytes) -> Dict[str, Any]:
+    """Parse speed (e.g., b"1.5x")."""
+    return {'speed': float(value.rstrip(b'x'))}
+
+
+def _parse_bitrate(value: bytes) -> Dict[str, Any]:
+    """Parse bitrate (e.g., b"1234.5kbits/s") and convert to Mbps."""
+    bitrate_kbps = float(value.replace(b'kbits/s', b'').strip())
+    return {'bitrate_mbps': bitrate_kbps / 1000.0}
+
+
+# ffprobe arguments selecting what to report: everything, or only the
+# fields VideoAnalyzer reads (a much smaller JSON for multi-stream files)
+_FULL_PROBE_ARGS = ('-show_format', '-show_streams')
+_MINIMAL_PROBE_ARGS = (
+    '-show_entries',
+    'format=duration,format_name,bit_rate'
+    ':stream=codec_type,codec_name,codec_long_name,width,height,'
+    'r_frame_rate,pix_fmt,sample_rate,channels',
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(file_path: str, mtime_ns: int, size: int,
+                  show_args: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Run ffprobe on a file, caching the parsed result.
+
+    mtime_ns and size are part of the cache key so a modified file is probed
+    again, and show_args so full and minimal probes are cached separately.
+    Failures raise and are therefore never cached.
+    """
+    cmd = [
+        config.FFPROBE_BINARY,
+        '-v', 'quiet',
+        '-print_format', 'json',
+        *show_args,
+        file_path
+    ]
+
+    logger.debug("Running ffprobe on: %s", file_path)
+    # -v quiet leaves nothing useful on stderr, so don't open a pipe for it
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=30
+    )
+
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, cmd)
+
+    return _json_loads(result.stdout)
+
+
+@functools.lru_cache(maxsize=4)
+def _format_hms(seconds: int) -> str:
+    """Format whole seconds as HH:MM:SS (cached; progress repeats the same second)."""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+# Handlers for the -progress keys we care about, keyed by FFmpeg key name.
+# Progress output is ASCII, so keys and values are handled as raw bytes.
+_PROGRESS_PARSERS: Dict[bytes, Callable[[bytes], Dict[str, Any]]] = {
+    b'out_time_ms': _parse_out_time,
+    b'speed': _parse_speed,
+    b'bitrate': _parse_bitrate,
+}
+
 
 class FFmpegWrapper:
     """Wrapper class for FFmpeg operations."""
 
     @staticmethod
-    def get_video_info(file_path: str) -> Optional[Dict[str, Any]]:
+    def get_video_info(file_path: str,
+                       file_stat: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
         """
         Get video information using ffprobe.
 
+        Results are cached per file path, modification time and size, so
+        repeated calls for an unchanged file do not spawn ffprobe again.
+        The returned dictionary is shared and must not be modified.
+
         Args:
             file_path: Path to video file
+            file_stat: Optional os.stat() result for file_path, to avoid re-statting
 
         Returns:
             Dictionary with video information or None on error
         """
-        cmd = [
-            config.FFPROBE_BINARY,
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            file_path
-        ]
+        return FFmpegWrapper._probe(file_path, file_stat, _FULL_PROBE_ARGS)
 
-        try:
-            logger.debug(f"Running ffprobe on: {file_path}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+    @staticmethod
+    def get_video_info_minimal(file_path: str,
+                               file_stat: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get only the video information VideoAnalyzer needs using ffprobe.
+
+        Same as get_video_info, but ffprobe reports just duration, format
+        name, bit rate and the basic per-stream codec, size, frame rate and
+        audio fields, which keeps the output small for files with many
+        streams. The returned dictionary is shared and must not be modified.
+
+        Args:
+            file_path: Path to video file
+            file_stat: Optional os.stat() result for file_path, to avoid re-statting
+
+        Returns:
+            Dictionary with video information or None on error
+        """
+        return FFmpegWrapper._probe(file_path, file_stat, _MINIMAL_PROBE_ARGS)
 
-            if result.returncode != 0:
-                logger.error(f"ffprobe failed: {result.stderr}")
-                return None
+    @staticmethod
+    def _probe(file_path: str, file_stat: Optional[os.stat_result],
+               show_args: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """
+        Run a cached ffprobe query and log any failure.
 
-            info = json.loads(result.stdout)
-            logger.debug(f"Video info retrieved for: {file_path}")
+        Args:
+            file_path: Path to video file
+            file_stat: Optional os.stat() result for file_path
+            show_args: ffprobe arguments selecting the reported fields
+
+        Returns:
+            Dictionary with video information or None on error
+        """
+        try:
+            st = file_stat or os.stat(file_path)
+            info = _probe_cached(os.path.abspath(file_path), st.st_mtime_ns, st.st_size, show_args)
+            logger.debug("Video info retrieved for: %s", file_path)
             return info
 
+        except subprocess.CalledProcessError as e:
+            logger.error("ffprobe failed with exit code %d for file: %s", e.returncode, file_path)
+            return None
         except subprocess.TimeoutExpired:
-            logger.error(f"ffprobe timeout for file: {file_path}")
+            logger.error("ffprobe timeout for file: %s", file_path)
             return None
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse ffprobe output: {e}")
+            logger.error("Failed to parse ffprobe output: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error getting video info: {e}")
+            logger.error("Error getting video info: %s", e)
             return None
 
     @staticmethod
@@ -81,56 +276,86 @@ class FFmpegWrapper:
             input_file: Input video file path
             output_file: Output video file path
             progress_callback: Optional callback for progress updates.
-                              Called with dict containing 'frame', 'fps', 'time', 'speed', 'progress'
+                              Called once per FFmpeg progress block with a dict containing
+                              'time', 'time_formatted', 'speed', 'bitrate_mbps' and 'progress'
             error_callback: Optional callback for error messages
             cancel_check: Optional callback that returns True if conversion should be cancelled
 
         Returns:
             True if conversion successful, False otherwise
         """
-        # Get video duration for progress calculation
-        video_info = FFmpegWrapper.get_video_info(input_file)
+        # Input duration for progress calculation, parsed from FFmpeg's stderr
+        # banner; progress has no 'progress' key until it is known
         total_duration = None
 
-        if video_info:
-            try:
-                format_info = video_info.get('format', {})
-                total_duration = float(format_info.get('duration', 0))
-                logger.info(f"Video duration: {total_duration:.2f} seconds")
-            except (ValueError, TypeError):
-                logger.warning("Could not determine video duration")
-
         # Build FFmpeg command
         cmd = config.get_ffmpeg_command_args(input_file, output_file)
 
-        logger.info(f"Starting conversion: {input_file} -> {output_file}")
-        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+        logger.info("Starting conversion: %s -> %s", input_file, output_file)
+        logger.debug("FFmpeg command: %s", ' '.join(cmd))
 
         try:
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
+                stderr=subprocess.PIPE
             )
 
-            # Read stderr in a separate thread to prevent blocking
-            def read_stderr():
-                for line in process.stderr:
-                    line = line.strip()
-                    if 'error' in line.lower() or 'failed' in line.lower():
-                        logger.error(f"FFmpeg error: {line}")
-                        if error_callback:
-                            error_callback(line)
-
-            stderr_thread = threading.Thread(target=read_stderr, daemon=True)
-            stderr_thread.start()
-
-            # Parse progress output from stdout
+            # Fields accumulated for the current progress block
+            progress_data = {}
+            # Last stderr lines, logged if the conversion fails
+            stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+
+            def handle_stdout(line: bytes):
+                nonlocal progress_data
+
+                # FFmpeg progress format with -progress pipe:1 is key=value pairs,
+                # with each block terminated by a "progress=continue|end" line
+                if b'=' not in line:
+                    return
+
+                key, value = line.split(b'=', 1)
+                logger.debug("FFmpeg progress line: %r", line)
+
+                if key == b'progress':
+                    if progress_data and progress_callback:
+                        current_time = progress_data.get('time')
+                        if current_time is not None and total_duration and total_duration > 0:
+                            progress_percent = (current_time / total_duration) * 100
+                            progress_data['progress'] = min(progress_percent, 100.0)
+                        progress_callback(progress_data)
+                    progress_data = {}
+
+                elif key in _PROGRESS_PARSERS:
+                    try:
+                        progress_data.update(_PROGRESS_PARSERS[key](value))
+                    except (ValueError, IndexError) as e:
+                        logger.debug("Error parsing %r: %s", key, e)
+
+            def handle_stderr(raw_line: bytes):
+                nonlocal total_duration
+
+                if total_duration is None:
+                    duration_match = _DURATION_RE.search(raw_line)
+                    if duration_match:
+                        hours, minutes, seconds = duration_match.groups()
+                        total_duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+                        logger.info("Video duration: %.2f seconds", total_duration)
+
+                # Kept as bytes; only decoded if the conversion fails
+                stderr_tail.append(raw_line)
+                if _ERROR_RE.search(raw_line):
+                    line = raw_line.decode('utf-8', errors='replace')
+                    logger.error("FFmpeg error: %s", line)
+                    if error_callback:
+                        error_callback(line)
+
+            # Read stdout (progress) and stderr (log), handling both on this thread
             # Note: With -progress pipe:1, progress goes to stdout in key=value format
             logger.info("Reading progress from FFmpeg...")
 
-            for line in process.stdout:
+            handlers = (handle_stdout, handle_stderr)
+            for item in _iter_output_lines(process):
                 # Check if we should cancel
                 if cancel_check and cancel_check():
                     logger.info("Cancellation requested, terminating FFmpeg process")
@@ -143,72 +368,21 @@ class FFmpegWrapper:
                         process.wait()
                     return False
 
-                line = line.strip()
-
-                if not line:
-                    continue
-
-                # FFmpeg progress format with -progress pipe:1 is key=value pairs
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    logger.debug(f"FFmpeg progress key: {key} = {value}")
-
-                    if key == 'out_time_ms':
-                        # Parse microseconds (despite the name, it's actually microseconds!)
-                        try:
-                            time_us = int(value)
-                            current_time = time_us / 1000000.0  # Convert microseconds to seconds
-
-                            progress_data = {
-                                'time': current_time,
-                                'time_formatted': FFmpegWrapper._format_time(current_time)
-                            }
-
-                            if total_duration and total_duration > 0:
-                                progress_percent = (current_time / total_duration) * 100
-                                progress_data['progress'] = min(progress_percent, 100.0)
-
-                            if progress_callback:
-                                logger.debug(f"Progress: {progress_percent:.1f}%")
-                                progress_callback(progress_data)
-
-                        except (ValueError, IndexError) as e:
-                            logger.debug(f"Error parsing out_time_ms: {e}")
-
-                    elif key == 'speed':
-                        # Parse speed (e.g., "1.5x")
-                        try:
-                            speed_str = value.rstrip('x')
-                            speed = float(speed_str)
-                            if progress_callback:
-                                progress_callback({'speed': speed})
-                        except (ValueError, IndexError):
-                            pass
-
-                    elif key == 'bitrate':
-                        # Parse bitrate (e.g., "1234.5kbits/s")
-                        try:
-                            # Remove "kbits/s" suffix and convert to Mbps
-                            bitrate_str = value.replace('kbits/s', '').strip()
-                            bitrate_kbps = float(bitrate_str)
-                            bitrate_mbps = bitrate_kbps / 1000.0  # Convert to Mbps
-                            logger.debug(f"Parsed bitrate: {bitrate_mbps:.1f} Mbps")
-                            if progress_callback:
-                                progress_callback({'bitrate_mbps': bitrate_mbps})
-                        except (ValueError, IndexError) as e:
-                            logger.debug(f"Error parsing bitrate: {e}")
+                if item is not None:
+                    stream_index, line = item
+                    handlers[stream_index](line)
 
             # Wait for process to complete
             return_code = process.wait()
-            logger.info(f"FFmpeg process completed with code {return_code}")
+            logger.info("FFmpeg process completed with code %d", return_code)
 
             if return_code == 0:
-                logger.info(f"Conversion successful: {output_file}")
+                logger.info("Conversion successful: %s", output_file)
                 return True
             else:
-                stderr_output = process.stderr.read() if process.stderr else ""
-                logger.error(f"Conversion failed with return code {return_code}")
-                logger.error(f"FFmpeg stderr: {stderr_output}")
+                stderr_output = b"\n".join(stderr_tail).decode('utf-8', errors='replace')
+                logger.error("Conversion failed with return code %d", return_code)
+                logger.error("FFmpeg stderr: %s", stderr_output)
 
                 if error_callback:
                     error_callback(f"Conversion failed (code {return_code})")
@@ -221,72 +395,11 @@ class FFmpegWrapper:
                 error_callback("Conversion timeout")
             return False
         except Exception as e:
-            logger.error(f"Error during conversion: {e}")
+            logger.error("Error during conversion: %s", e)
             if error_callback:
                 error_callback(str(e))
             return False
 
-    @staticmethod
-    def _parse_progress_line(line: str, total_duration: Optional[float] = None) -> Optional[Dict[str, Any]]:
-        """
-        Parse FFmpeg progress output line.
-
-        Args:
-            line: Progress line from FFmpeg
-            total_duration: Total video duration in seconds
-
-        Returns:
-            Dictionary with progress information or None
-        """
-        try:
-            progress_data = {}
-
-            # Extract frame number
-            frame_match = re.search(r'frame=\s*(\d+)', line)
-            if frame_match:
-                progress_data['frame'] = int(frame_match.group(1))
-
-            # Extract fps
-            fps_match = re.search(r'fps=\s*(\d+\.?\d*)', line)
-            if fps_match:
-                progress_data['fps'] = float(fps_match.group(1))
-
-            # Extract time (format: HH:MM:SS.ms)
-            time_match = re.search(r'time=(\d{2}):(\d{2}):(\d{2}\.\d{2})', line)
-            if time_match:
-                hours = int(time_match.group(1))
-                minutes = int(time_match.group(2))
-                seconds = float(time_match.group(3))
-                current_time = hours * 3600 + minutes * 60 + seconds
-                progress_data['time'] = current_time
-                progress_data['time_formatted'] = f"{hours:02d}:{minutes:02d}:{int(seconds):02d}"
-
-                # Calculate progress percentage if we have total duration
-                if total_duration and total_duration > 0:
-                    progress_percent = (current_time / total_duration) * 100
-                    progress_data['progress'] = min(progress_percent, 100.0)
-
-            # Extract speed
-            speed_match = re.search(r'speed=\s*(\d+\.?\d*)x', line)
-            if speed_match:
-                progress_data['speed'] = float(speed_match.group(1))
-
-            # Extract bitrate
-            bitrate_match = re.search(r'bitrate=\s*(\d+\.?\d*)\s*kbits/s', line)
-            if bitrate_match:
-                progress_data['bitrate'] = float(bitrate_match.group(1))
-
-            # Extract size
-            size_match = re.search(r'size=\s*(\d+)kB', line)
-            if size_match:
-                progress_data['size_kb'] = int(size_match.group(1))
-
-            return progress_data if progress_data else None
-
-        except Exception as e:
-            logger.debug(f"Error parsing progress line: {e}")
-            return None
-
     @staticmethod
     def cancel_conversion(process: subprocess.Popen):
         """
@@ -310,7 +423,7 @@ class FFmpegWrapper:
             logger.info("Conversion cancelled")
 
         except Exception as e:
-            logger.error(f"Error cancelling conversion: {e}")
+            logger.error("Error cancelling conversion: %s", e)
 
     @staticmethod
     def _format_time(seconds: float) -> str:
@@ -323,7 +436,4 @@ class FFmpegWrapper:
         Returns:
             Formatted time string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return _format_hms(int(seconds))
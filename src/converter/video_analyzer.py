@@ -1,16 +1,40 @@
 """
 Video analysis and metadata extraction.
 """
-import sys
-from pathlib import Path
+import functools
+import os
+from bisect import bisect_left
 from typing import Optional, Dict, Any
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from converter.ffmpeg_wrapper import FFmpegWrapper
 from utils.logger import logger
 
+# Approximate H.264 video bitrates at CRF 18, by resolution.
+# A pixel count up to _PIXEL_THRESHOLDS[i] maps to _VIDEO_BITRATES_KBPS[i];
+# the final bitrate covers everything above 1440p (4K and above).
+_PIXEL_THRESHOLDS = (
+    1280 * 720,   # 720p or less
+    1920 * 1080,  # 1080p
+    2560 * 1440,  # 1440p
+)
+_VIDEO_BITRATES_KBPS = (3000, 6000, 12000, 20000)
+
+# (unit, decimal places) indexed by power of 1024; sizes cap out at GB
+_SIZE_UNITS = (('B', 0), ('KB', 1), ('MB', 1), ('GB', 2))
+
+
+@functools.lru_cache(maxsize=128)
+def _format_duration(seconds: int) -> str:
+    """Format whole seconds as MM:SS or HH:MM:SS (cached per second)."""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    else:
+        return f"{minutes:02d}:{secs:02d}"
+
 
 class VideoAnalyzer:
     """Analyze video files and extract metadata."""
@@ -26,7 +50,13 @@ class VideoAnalyzer:
         Returns:
             Dictionary with video metadata or None on error
         """
-        info = FFmpegWrapper.get_video_info(file_path)
+        try:
+            st = os.stat(file_path)
+        except OSError as e:
+            logger.error("Cannot access video file: %s", e)
+            return None
+
+        info = FFmpegWrapper.get_video_info_minimal(file_path, st)
 
         if not info:
             return None
@@ -34,9 +64,9 @@ class VideoAnalyzer:
         try:
             metadata = {
                 'file_path': file_path,
-                'file_name': Path(file_path).name,
-                'file_size_bytes': Path(file_path).stat().st_size,
-                'file_size_mb': Path(file_path).stat().st_size / (1024 * 1024),
+                'file_name': os.path.basename(file_path),
+                'file_size_bytes': st.st_size,
+                'file_size_mb': st.st_size / (1024 * 1024),
             }
 
             # Extract format information
@@ -65,7 +95,7 @@ class VideoAnalyzer:
                 metadata['fps'] = VideoAnalyzer._parse_frame_rate(video_stream.get('r_frame_rate', '0/1'))
                 metadata['pixel_format'] = video_stream.get('pix_fmt', 'unknown')
             else:
-                logger.warning(f"No video stream found in {file_path}")
+                logger.warning("No video stream found in %s", file_path)
                 return None
 
             # Extract audio stream information
@@ -81,11 +111,11 @@ class VideoAnalyzer:
             # Estimate output file size
             metadata['estimated_output_size_mb'] = VideoAnalyzer.estimate_output_size(metadata)
 
-            logger.debug(f"Metadata extracted for {file_path}")
+            logger.debug("Metadata extracted for %s", file_path)
             return metadata
 
         except Exception as e:
-            logger.error(f"Error extracting metadata: {e}")
+            logger.error("Error extracting metadata: %s", e)
             return None
 
     @staticmethod
@@ -139,15 +169,7 @@ class VideoAnalyzer:
             pixels = width * height
 
             # Estimate bitrate based on resolution and CRF 18
-            # These are approximate values for H.264 with CRF 18
-            if pixels <= 1280 * 720:  # 720p or less
-                estimated_video_bitrate = 3000  # kbps
-            elif pixels <= 1920 * 1080:  # 1080p
-                estimated_video_bitrate = 6000  # kbps
-            elif pixels <= 2560 * 1440:  # 1440p
-                estimated_video_bitrate = 12000  # kbps
-            else:  # 4K and above
-                estimated_video_bitrate = 20000  # kbps
+            estimated_video_bitrate = _VIDEO_BITRATES_KBPS[bisect_left(_PIXEL_THRESHOLDS, pixels)]
 
             # Audio bitrate (320 kbps AAC)
             audio_bitrate = 320  # kbps
@@ -161,11 +183,11 @@ class VideoAnalyzer:
             # Add 5% overhead for container
             estimated_size_mb *= 1.05
 
-            logger.debug(f"Estimated output size: {estimated_size_mb:.2f} MB")
+            logger.debug("Estimated output size: %.2f MB", estimated_size_mb)
             return estimated_size_mb
 
         except Exception as e:
-            logger.error(f"Error estimating output size: {e}")
+            logger.error("Error estimating output size: %s", e)
             # Fallback: assume similar size to input
             return metadata.get('file_size_mb', 0) * 1.05
 
@@ -206,14 +228,7 @@ class VideoAnalyzer:
         Returns:
             Formatted duration string (HH:MM:SS)
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+        return _format_duration(int(seconds))
 
     @staticmethod
     def format_file_size(size_bytes: int) -> str:
@@ -228,9 +243,8 @@ class VideoAnalyzer:
         """
         if size_bytes < 1024:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+
+        # Each unit is a factor of 2**10, so the unit index is bit_length // 10
+        index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        unit, precision = _SIZE_UNITS[index]
+        return f"{size_bytes / (1 << (10 * index)):.{precision}f} {unit}"
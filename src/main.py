@@ -4,19 +4,88 @@ Video Converter GUI - Main Entry Point
 A user-friendly application for converting MP4 videos to MOV format
 optimized for DaVinci Resolve video editing.
 """
+import hashlib
+import os
+import re
 import sys
-from pathlib import Path
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QSplashScreen
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtGui import QIcon
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add src directory to path (plain string ops; computed once at import)
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+_RESOURCES_DIR = os.path.join(_SRC_DIR, 'resources')
+sys.path.insert(0, _SRC_DIR)
 
-from ui.main_window import MainWindow
+from ui.icon_cache import IconCache
 from utils.config import config
 from utils.logger import logger
 
+# QSS comments, whitespace around punctuation, and remaining whitespace runs
+_QSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_QSS_PUNCT_SPACE_RE = re.compile(r'\s*([{};,])\s*')
+_QSS_SPACE_RE = re.compile(r'\s+')
+
+# Edge length of the startup splash (the icon itself is 2000x2000)
+_SPLASH_SIZE = 256
+
+
+def _minify_stylesheet(stylesheet: str) -> str:
+    """
+    Strip comments and redundant whitespace from a QSS stylesheet.
+
+    Whitespace inside selectors is significant (descendant combinator),
+    so runs are collapsed to a single space rather than removed.
+
+    Args:
+        stylesheet: QSS source text
+
+    Returns:
+        Minified stylesheet text
+    """
+    stylesheet = _QSS_COMMENT_RE.sub('', stylesheet)
+    stylesheet = _QSS_PUNCT_SPACE_RE.sub(r'\1', stylesheet)
+    return _QSS_SPACE_RE.sub(' ', stylesheet).strip()
+
+
+def _read_stylesheet(stylesheet_path: str, theme: str) -> str:
+    """
+    Read a stylesheet, using a minified copy cached in the config directory.
+
+    The cache file name is derived from the source's mtime, size and theme,
+    so editing the stylesheet invalidates it automatically.
+
+    Args:
+        stylesheet_path: Path to the .qss source file
+        theme: Theme name the stylesheet belongs to
+
+    Returns:
+        Minified stylesheet text
+    """
+    st = os.stat(stylesheet_path)
+    key = f"{st.st_mtime_ns}:{st.st_size}:{theme}".encode('utf-8')
+    cache_dir = config.config_dir / 'cache'
+    cache_path = cache_dir / f"{hashlib.sha1(key).hexdigest()}.qss"
+
+    try:
+        return cache_path.read_text(encoding='utf-8')
+    except OSError:
+        pass
+
+    with open(stylesheet_path, 'r', encoding='utf-8') as f:
+        stylesheet = _minify_stylesheet(f.read())
+
+    # Write atomically so a concurrent launch never reads a partial file
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(stylesheet, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache stylesheet: {e}")
+
+    return stylesheet
+
 
 def load_stylesheet(app: QApplication, theme: str = None) -> None:
     """
@@ -37,13 +106,11 @@ def load_stylesheet(app: QApplication, theme: str = None) -> None:
         else:
             stylesheet_file = 'styles.qss'
 
-        stylesheet_path = Path(__file__).parent / 'resources' / stylesheet_file
+        stylesheet_path = os.path.join(_RESOURCES_DIR, stylesheet_file)
 
-        if stylesheet_path.exists():
-            with open(stylesheet_path, 'r', encoding='utf-8') as f:
-                stylesheet = f.read()
-                app.setStyleSheet(stylesheet)
-                logger.info(f"Stylesheet loaded successfully: {theme} mode")
+        if os.path.exists(stylesheet_path):
+            app.setStyleSheet(_read_stylesheet(stylesheet_path, theme))
+            logger.info(f"Stylesheet loaded successfully: {theme} mode")
         else:
             logger.warning(f"Stylesheet not found: {stylesheet_path}")
 
@@ -61,21 +128,45 @@ def main():
     app.setApplicationVersion(config.APP_VERSION)
     app.setOrganizationName(config.ORGANIZATION)
 
-    # Set application icon
-    icon_path = Path(__file__).parent / 'resources' / 'app_icon.png'
-    if icon_path.exists():
-        app.setWindowIcon(QIcon(str(icon_path)))
+    # Set application icon and show it as a splash while the UI loads
+    splash = None
+    icon_path = os.path.join(_RESOURCES_DIR, 'app_icon.png')
+    if os.path.exists(icon_path):
+        app.setWindowIcon(QIcon(IconCache.get(icon_path)))
         logger.info(f"Application icon set: {icon_path}")
 
+        splash = QSplashScreen(IconCache.get_scaled(icon_path, _SPLASH_SIZE, _SPLASH_SIZE))
+        splash.show()
+        app.processEvents()
+
     # Note: High DPI scaling is enabled by default in PyQt6
 
     # Load stylesheet
     load_stylesheet(app)
 
+    # Imported here so the splash is on screen while the UI modules and
+    # the converter they pull in are loaded
+    from ui.main_window import MainWindow
+    from ui.about_dialog import AboutDialog
+    from ui.settings_dialog import HardwareDetectRunnable, register_stylesheet_loader
+
+    # Lets the settings dialog re-theme the app without importing main
+    register_stylesheet_loader(load_stylesheet)
+
+    # Probe FFmpeg's hardware encoders in the background; the result is
+    # cached in config for the settings dialog and the first conversion
+    QThreadPool.globalInstance().start(HardwareDetectRunnable())
+
+    # Pre-scale the About dialog icon so its first open doesn't decode it
+    if os.path.exists(icon_path):
+        IconCache.get_scaled(icon_path, AboutDialog.ICON_SIZE, AboutDialog.ICON_SIZE)
+
     # Create and show main window
     logger.info(f"Starting {config.APP_NAME} v{config.APP_VERSION}")
     window = MainWindow()
     window.show()
+    if splash:
+        splash.finish(window)
 
     # Run application
     exit_code = app.exec()
@@ -1,29 +1,37 @@
 """
 About dialog for FrameConverter.
 """
-import sys
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QWidget
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QDesktopServices
+from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtCore import QUrl
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from ui.icon_cache import IconCache
 from utils.config import config
 from utils.logger import logger
 
+_RESOURCES_DIR = Path(__file__).parent.parent / 'resources'
+
+# Dialog text that is fixed for the life of the process
+_TITLE_STR = f"About {config.APP_NAME}"
+_VERSION_STR = f"Version {config.APP_VERSION}"
+_COMPANY_STR = config.ORGANIZATION
+_COPYRIGHT_STR = f"© 2025 {config.ORGANIZATION}. All rights reserved."
+
 
 class AboutDialog(QDialog):
     """About dialog showing app information and creator details."""
 
+    # Edge length of the app icon shown in the dialog
+    ICON_SIZE = 140
+
     def __init__(self, parent=None):
         """Initialize about dialog."""
         super().__init__(parent)
-        self.setWindowTitle(f"About {config.APP_NAME}")
+        self.setWindowTitle(_TITLE_STR)
         self.setModal(True)
         self.setMinimumSize(700, 450)
         self.resize(750, 480)
@@ -43,12 +51,10 @@ class AboutDialog(QDialog):
         left_layout = QVBoxLayout()
         left_layout.addStretch()
 
-        icon_path = Path(__file__).parent.parent / 'resources' / 'app_icon.png'
+        icon_path = _RESOURCES_DIR / 'app_icon.png'
         if icon_path.exists():
             icon_label = QLabel()
-            pixmap = QPixmap(str(icon_path))
-            scaled_pixmap = pixmap.scaled(140, 140, Qt.AspectRatioMode.KeepAspectRatio,
-                                         Qt.TransformationMode.SmoothTransformation)
+            scaled_pixmap = IconCache.get_scaled(str(icon_path), self.ICON_SIZE, self.ICON_SIZE)
             icon_label.setPixmap(scaled_pixmap)
             left_layout.addWidget(icon_label)
 
@@ -62,21 +68,11 @@ class AboutDialog(QDialog):
         # App name and version
         name_label = QLabel(config.APP_NAME)
         name_label.setObjectName("aboutAppName")
-        name_label.setStyleSheet("""
-            font-size: 28px;
-            font-weight: 700;
-            letter-spacing: -0.02em;
-        """)
         right_layout.addWidget(name_label)
 
         # Version
-        version_label = QLabel(f"Version {config.APP_VERSION}")
+        version_label = QLabel(_VERSION_STR)
         version_label.setObjectName("aboutVersion")
-        version_label.setStyleSheet("""
-            font-size: 13px;
-            opacity: 0.6;
-            margin-bottom: 8px;
-        """)
         right_layout.addWidget(version_label)
 
         # Description
@@ -85,11 +81,6 @@ class AboutDialog(QDialog):
         description = QLabel(desc_text)
         description.setWordWrap(True)
         description.setObjectName("aboutDescription")
-        description.setStyleSheet("""
-            font-size: 13px;
-            opacity: 0.6;
-            line-height: 1.5;
-        """)
         right_layout.addWidget(description)
 
         right_layout.addSpacing(16)
@@ -97,20 +88,11 @@ class AboutDialog(QDialog):
         # Creator section
         creator_label = QLabel("Created by Pablo Navarro")
         creator_label.setObjectName("aboutCreator")
-        creator_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: 600;
-        """)
         right_layout.addWidget(creator_label)
 
         # Company label
-        company_label = QLabel(f"{config.ORGANIZATION}")
+        company_label = QLabel(_COMPANY_STR)
         company_label.setObjectName("aboutCompany")
-        company_label.setStyleSheet("""
-            font-size: 13px;
-            opacity: 0.6;
-            margin-top: 4px;
-        """)
         right_layout.addWidget(company_label)
 
         right_layout.addSpacing(16)
@@ -141,14 +123,9 @@ class AboutDialog(QDialog):
         main_layout.addLayout(content_layout)
 
         # Copyright
-        copyright_label = QLabel(f"© 2025 {config.ORGANIZATION}. All rights reserved.")
+        copyright_label = QLabel(_COPYRIGHT_STR)
         copyright_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         copyright_label.setObjectName("aboutCopyright")
-        copyright_label.setStyleSheet("""
-            font-size: 11px;
-            opacity: 0.5;
-            margin-top: 16px;
-        """)
         main_layout.addWidget(copyright_label)
 
         # Close button
@@ -158,19 +135,6 @@ class AboutDialog(QDialog):
         close_button.setCursor(Qt.CursorShape.PointingHandCursor)
         close_button.setFixedHeight(36)
         close_button.setFixedWidth(100)
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #0A84FF;
-            }
-        """)
 
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -196,61 +160,8 @@ class AboutDialog(QDialog):
         button.setCursor(Qt.CursorShape.PointingHandCursor)
         button.clicked.connect(lambda: self._open_url(url))
 
-        # Style based on button type
-        if button_type == "coffee":
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #FFDD00;
-                    color: #000000;
-                    border: none;
-                    border-radius: 10px;
-                    padding: 0px 20px;
-                    font-size: 14px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: #FFE44D;
-                }
-                QPushButton:pressed {
-                    background-color: #F5D000;
-                }
-            """)
-        elif button_type == "twitter":
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #1DA1F2;
-                    color: white;
-                    border: none;
-                    border-radius: 10px;
-                    padding: 0px 20px;
-                    font-size: 14px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: #3AB3FF;
-                }
-                QPushButton:pressed {
-                    background-color: #0D8ECF;
-                }
-            """)
-        else:
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #007AFF;
-                    color: white;
-                    border: none;
-                    border-radius: 10px;
-                    padding: 0px 20px;
-                    font-size: 14px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: #0A84FF;
-                }
-                QPushButton:pressed {
-                    background-color: #0070E0;
-                }
-            """)
+        # Colors come from the "variant" rules in the app stylesheet
+        button.setProperty("variant", button_type)
 
         return button
 
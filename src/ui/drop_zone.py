@@ -1,19 +1,26 @@
 """
 Drag and drop zone widget for video files.
 """
-import sys
-from pathlib import Path
+import re
+from typing import Dict, List, Tuple
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QDragEnterEvent, QDropEvent
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from PyQt6.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent
 
 from utils.config import config
-from utils.validators import is_valid_video_file
+from utils.validators import is_valid_video_files_batch
 from utils.logger import logger
 
+# Accepted drag payload: local paths ending in .mp4 (any case). The suffix
+# tuple covers real-world names without allocating; the regex catches the rest.
+_MP4_SUFFIXES = ('.mp4', '.MP4')
+_MP4_RE = re.compile(r'\.mp4$', re.IGNORECASE)
+
+
+def _is_mp4_path(file_path: str) -> bool:
+    """Check for an .mp4 extension in any letter case."""
+    return file_path.endswith(_MP4_SUFFIXES) or _MP4_RE.search(file_path) is not None
+
 
 class DropZone(QWidget):
     """
@@ -30,6 +37,8 @@ class DropZone(QWidget):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self._is_dragging = False
+        # Decided on drag enter and reused by move events of the same drag
+        self._drag_accepted = False
         self._setup_ui()
 
     def _setup_ui(self):
@@ -79,25 +88,46 @@ class DropZone(QWidget):
         Args:
             event: Drag enter event
         """
-        if event.mimeData().hasUrls():
-            # Check if at least one URL is a valid video file
-            has_valid_file = False
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith('.mp4'):
-                    has_valid_file = True
-                    break
-
-            if has_valid_file:
-                event.acceptProposedAction()
-                self._is_dragging = True
-                self._update_style()
-                logger.debug("Drag enter accepted")
-            else:
-                event.ignore()
+        self._drag_accepted = self._accepts_drag(event)
+        if self._drag_accepted:
+            event.acceptProposedAction()
+            self._is_dragging = True
+            self._update_style()
+            logger.debug("Drag enter accepted")
+        else:
+            event.ignore()
+
+    def dragMoveEvent(self, event: QDragMoveEvent):
+        """
+        Handle drag move event, reusing the decision made on drag enter.
+
+        Args:
+            event: Drag move event
+        """
+        if self._drag_accepted:
+            event.acceptProposedAction()
         else:
             event.ignore()
 
+    @staticmethod
+    def _accepts_drag(event: QDragEnterEvent) -> bool:
+        """
+        Check whether a drag carries at least one MP4 file.
+
+        Only called on drag enter; move events reuse the stored result, so
+        the URL list is scanned once per drag.
+
+        Args:
+            event: Drag enter event
+
+        Returns:
+            True if the drag should be accepted
+        """
+        mime_data = event.mimeData()
+        return mime_data.hasUrls() and any(
+            _is_mp4_path(url.toLocalFile()) for url in mime_data.urls()
+        )
+
     def dragLeaveEvent(self, event):
         """
         Handle drag leave event.
@@ -106,6 +136,7 @@ class DropZone(QWidget):
             event: Drag leave event
         """
         self._is_dragging = False
+        self._drag_accepted = False
         self._update_style()
         logger.debug("Drag leave")
 
@@ -117,43 +148,17 @@ class DropZone(QWidget):
             event: Drop event
         """
         self._is_dragging = False
+        self._drag_accepted = False
         self._update_style()
 
-        files = []
-        invalid_files = []
-        error_messages = {}
-
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-
-            # Validate file
-            is_valid, message = is_valid_video_file(file_path)
-            if is_valid:
-                files.append(file_path)
-                logger.info(f"File dropped: {file_path}")
-            else:
-                file_name = Path(file_path).name
-                invalid_files.append(file_name)
-                error_messages[file_name] = message
-                logger.warning(f"Invalid file dropped: {file_path} - {message}")
+        files, errors = self._partition_valid([url.toLocalFile() for url in event.mimeData().urls()])
 
         if files:
             self.files_dropped.emit(files)
             event.acceptProposedAction()
 
-        if invalid_files:
-            # Show detailed error message for the first invalid file
-            first_invalid = invalid_files[0]
-            error_msg = error_messages[first_invalid]
-
-            if len(invalid_files) > 1:
-                error_msg += f"\n\n(And {len(invalid_files) - 1} other file(s) were also invalid)"
-
-            QMessageBox.warning(
-                self,
-                "Invalid File",
-                error_msg
-            )
+        if errors:
+            self._show_invalid_files(errors)
 
     def _on_browse_clicked(self):
         """Handle browse button click."""
@@ -163,37 +168,58 @@ class DropZone(QWidget):
         file_dialog.setWindowTitle("Select Video Files")
 
         if file_dialog.exec():
-            files = file_dialog.selectedFiles()
-            valid_files = []
-            invalid_files = []
-            error_messages = {}
-
-            for file_path in files:
-                is_valid, message = is_valid_video_file(file_path)
-                if is_valid:
-                    valid_files.append(file_path)
-                else:
-                    file_name = Path(file_path).name
-                    invalid_files.append(file_name)
-                    error_messages[file_name] = message
+            valid_files, errors = self._partition_valid(file_dialog.selectedFiles())
 
             if valid_files:
                 logger.info(f"Files selected via browse: {len(valid_files)} files")
                 self.files_dropped.emit(valid_files)
 
-            if invalid_files:
-                # Show detailed error message
-                first_invalid = invalid_files[0]
-                error_msg = error_messages[first_invalid]
+            if errors:
+                self._show_invalid_files(errors)
+
+    def _partition_valid(self, paths: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Split paths into valid video files and rejected ones in a single pass.
+
+        Args:
+            paths: File paths to validate
+
+        Returns:
+            Tuple of (valid paths, {invalid path: error message})
+        """
+        valid = []
+        errors = {}
+        append = valid.append
+        results = is_valid_video_files_batch(paths)
+
+        for file_path in paths:
+            is_valid, message = results[file_path]
+            if is_valid:
+                append(file_path)
+                logger.info("File added: %s", file_path)
+            else:
+                errors[file_path] = message
+                logger.warning("Invalid file: %s - %s", file_path, message)
+
+        return valid, errors
+
+    def _show_invalid_files(self, errors: Dict[str, str]):
+        """
+        Show the error for the first rejected file, noting how many others failed.
+
+        Args:
+            errors: Mapping of invalid path to error message, in input order
+        """
+        error_msg = next(iter(errors.values()))
 
-                if len(invalid_files) > 1:
-                    error_msg += f"\n\n(And {len(invalid_files) - 1} other file(s) were also invalid)"
+        if len(errors) > 1:
+            error_msg += f"\n\n(And {len(errors) - 1} other file(s) were also invalid)"
 
-                QMessageBox.warning(
-                    self,
-                    "Invalid File",
-                    error_msg
-                )
+        QMessageBox.warning(
+            self,
+            "Invalid File",
+            error_msg
+        )
 
     def _update_style(self):
         """Update widget style based on drag state."""
@@ -1,39 +1,411 @@
 """
 File list widget for displaying queued video files.
 """
-import sys
-from pathlib import Path
+import os
+from typing import Any, Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QListWidget, QListWidgetItem, QPushButton, QScrollArea
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QAbstractItemView, QApplication, QListView, QStyle,
+    QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QEvent, QModelIndex, QObject, QRect,
+    QRunnable, QSize, QThreadPool, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QGuiApplication, QPainter, QPixmap
 
-from converter.video_analyzer import VideoAnalyzer
+from utils.config import config
 from utils.logger import logger
 
+# Glyph and (light, dark) theme color per status
+_STATUS_GLYPHS = {
+    "pending": ("⏸", "#86868B", "#98989D"),
+    "processing": ("⏳", "#FF9500", "#FF9F0A"),
+    "completed": ("✓", "#34C759", "#32D74B"),
+    "failed": ("✗", "#FF3B30", "#FF453A"),
+}
+_STATUS_ICON_SIZE = 24  # logical pixels
+_STATUS_FONT_SIZE = 20
+
+# (light, dark) theme colors for the text FileItemDelegate paints
+_NAME_COLORS = ("#1D1D1F", "#FFFFFF")
+_DETAILS_COLORS = ("#86868B", "#98989D")
+_REMOVE_COLORS = ("#FF3B30", "#FF453A")
+
+# Row geometry in logical pixels. _ROW_MARGIN must match the vertical
+# margin of #fileList::item in the stylesheets.
+_ROW_MARGIN = 6
+_ROW_PADDING_H = 12
+_ROW_PADDING_V = 8
+_ROW_SPACING = 12
+_TEXT_SPACING = 4
+_STATUS_SLOT = _STATUS_ICON_SIZE + 16  # icon plus 8px padding either side
+_REMOVE_SIZE = 24
+_NAME_FONT_SIZE = 15
+_DETAILS_FONT_SIZE = 13
+_REMOVE_FONT_SIZE = 22
+
+# Title text for the counts that don't follow the "(N files)" form
+_TITLE_FORMS = {0: "Files to Convert:", 1: "Files to Convert: (1 file)"}
+
+# (theme, status) -> rendered icon; filled on first use (needs a QApplication)
+_STATUS_PIXMAPS: Dict[Tuple[str, str], QPixmap] = {}
+
+
+def _status_pixmap(status: str) -> QPixmap:
+    """
+    Get the status icon for the current theme, rendering it on first use.
+
+    Args:
+        status: Status string ("pending", "processing", "completed", "failed")
+
+    Returns:
+        Pixmap with the status glyph drawn in its theme color
+    """
+    key = (config.theme, status)
+    pixmap = _STATUS_PIXMAPS.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    glyph, light_color, dark_color = _STATUS_GLYPHS.get(status, _STATUS_GLYPHS["pending"])
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    side = round(_STATUS_ICON_SIZE * ratio)
+
+    pixmap = QPixmap(side, side)
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    font = painter.font()
+    font.setPixelSize(_STATUS_FONT_SIZE)
+    font.setBold(status == "completed")
+    painter.setFont(font)
+    painter.setPen(QColor(dark_color if config.theme == "dark" else light_color))
+    painter.drawText(QRect(0, 0, _STATUS_ICON_SIZE, _STATUS_ICON_SIZE),
+                     Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+
+    _STATUS_PIXMAPS[key] = pixmap
+    return pixmap
+
+
+class AnalyzeSignals(QObject):
+    """
+    Signals for AnalyzeRunnable (QRunnable is not a QObject).
+
+    Signals:
+        finished: Emitted with (file_path, analysis token, metadata dict or None)
+    """
+
+    finished = pyqtSignal(str, int, object)
+
+
+class AnalyzeRunnable(QRunnable):
+    """Extract a file's metadata on a thread pool thread."""
+
+    def __init__(self, file_path: str, token: int, signals: AnalyzeSignals):
+        """
+        Initialize analysis task.
+
+        Args:
+            file_path: Path to video file
+            token: Analysis token of the row the result is for
+            signals: Signals object to report the result through
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.token = token
+        self.signals = signals
+
+    def run(self):
+        """Run ffprobe and report the result (delivered on the GUI thread)."""
+        # Imported on first use so the ffprobe machinery isn't loaded at startup
+        from converter.video_analyzer import VideoAnalyzer
+
+        self.signals.finished.emit(self.file_path, self.token,
+                                   VideoAnalyzer.get_video_metadata(self.file_path))
+
+
+def _theme_color(colors: Tuple[str, str]) -> QColor:
+    """Pick the light or dark variant of a color for the current theme."""
+    return QColor(colors[1] if config.theme == "dark" else colors[0])
+
+
+class FileListModel(QAbstractListModel):
+    """
+    List model of queued files.
+
+    Each row holds the file path, its metadata (None while it is still
+    being analyzed), the details line shown under the name, and the
+    conversion status. Every appended row also gets a fresh analysis token,
+    so a result started for an earlier row of the same path can be told
+    apart and dropped.
+    """
+
+    PathRole = Qt.ItemDataRole.UserRole + 1
+    MetadataRole = Qt.ItemDataRole.UserRole + 2
+    StatusRole = Qt.ItemDataRole.UserRole + 3
+    DetailsRole = Qt.ItemDataRole.UserRole + 4
+
+    def __init__(self, parent=None):
+        """Initialize an empty file list model."""
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._row_of: Dict[str, int] = {}  # Map file_path -> row
+        self._next_token = 0  # Analysis token for the next appended row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of files (a list model has no children)."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return the value for a row and role."""
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row['name']
+        if role == self.PathRole:
+            return row['path']
+        if role == self.MetadataRole:
+            return row['metadata']
+        if role == self.StatusRole:
+            return row['status']
+        if role == self.DetailsRole:
+            return row['details']
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Set a row's metadata, details or status."""
+        if not index.isValid():
+            return False
+
+        keys = {self.MetadataRole: 'metadata', self.StatusRole: 'status', self.DetailsRole: 'details'}
+        key = keys.get(role)
+        if key is None:
+            return False
+
+        row = self._rows[index.row()]
+        if row[key] != value:
+            row[key] = value
+            self.dataChanged.emit(index, index, [role])
+        return True
+
+    def contains(self, file_path: str) -> bool:
+        """Check whether a file has a row (analyzed or not)."""
+        return file_path in self._row_of
+
+    def index_of(self, file_path: str) -> QModelIndex:
+        """Get the model index for a file, or an invalid index if absent."""
+        row = self._row_of.get(file_path)
+        return QModelIndex() if row is None else self.index(row)
+
+    def token_of(self, file_path: str) -> Optional[int]:
+        """Get the analysis token of a file's row, or None if absent."""
+        row = self._row_of.get(file_path)
+        return None if row is None else self._rows[row]['token']
+
+    def paths(self) -> List[str]:
+        """All file paths, in display order."""
+        return [row['path'] for row in self._rows]
+
+    def append_files(self, file_paths: List[str]):
+        """
+        Append placeholder rows for files that are about to be analyzed.
+
+        Args:
+            file_paths: New file paths (not already in the model)
+        """
+        if not file_paths:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(file_paths) - 1)
+        for offset, file_path in enumerate(file_paths):
+            self._rows.append({
+                'path': file_path,
+                'name': os.path.basename(file_path),
+                'metadata': None,
+                'details': "Analyzing…",
+                'status': "pending",
+                'token': self._next_token,
+            })
+            self._next_token += 1
+            self._row_of[file_path] = first + offset
+        self.endInsertRows()
+
+    def remove_file(self, file_path: str) -> bool:
+        """
+        Remove a file's row.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            True if the file was in the model
+        """
+        row = self._row_of.get(file_path)
+        if row is None:
+            return False
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._row_of[file_path]
+        for later in self._rows[row:]:
+            self._row_of[later['path']] -= 1
+        self.endRemoveRows()
+        return True
+
+    def clear(self):
+        """Remove every row in one model reset."""
+        self.beginResetModel()
+        self._rows.clear()
+        self._row_of.clear()
+        self.endResetModel()
+
+
+class FileItemDelegate(QStyledItemDelegate):
+    """
+    Paints file rows directly: status icon, name, details and a remove "×".
+
+    The row background (including hover) still comes from the
+    #fileList::item stylesheet rules; only the content is painted here.
+
+    Signals:
+        remove_clicked: Emitted with the file path when "×" is clicked
+    """
+
+    remove_clicked = pyqtSignal(str)
+
+    @staticmethod
+    def _fonts(base: QFont) -> Tuple[QFont, QFont, QFont]:
+        """Derive the name, details and remove-glyph fonts from the view font."""
+        name_font = QFont(base)
+        name_font.setPixelSize(_NAME_FONT_SIZE)
+        name_font.setWeight(QFont.Weight.DemiBold)
+
+        details_font = QFont(base)
+        details_font.setPixelSize(_DETAILS_FONT_SIZE)
+        details_font.setWeight(QFont.Weight.Medium)
+
+        remove_font = QFont(base)
+        remove_font.setPixelSize(_REMOVE_FONT_SIZE)
+        remove_font.setWeight(QFont.Weight.DemiBold)
+        return name_font, details_font, remove_font
+
+    @staticmethod
+    def _content_rect(row_rect: QRect) -> QRect:
+        """Area inside the row's stylesheet margin and padding."""
+        return row_rect.adjusted(_ROW_PADDING_H, _ROW_MARGIN + _ROW_PADDING_V,
+                                 -_ROW_PADDING_H, -(_ROW_MARGIN + _ROW_PADDING_V))
+
+    @classmethod
+    def _remove_rect(cls, row_rect: QRect) -> QRect:
+        """Hit area of the "×" remove glyph."""
+        content = cls._content_rect(row_rect)
+        top = content.top() + (content.height() - _REMOVE_SIZE) // 2
+        return QRect(content.right() - _REMOVE_SIZE + 1, top, _REMOVE_SIZE, _REMOVE_SIZE)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Every row has the same height (the view uses uniform item sizes)."""
+        name_font, details_font, _ = self._fonts(option.font)
+        text_height = (QFontMetrics(name_font).height() + _TEXT_SPACING
+                       + QFontMetrics(details_font).height())
+        content_height = max(text_height, _STATUS_SLOT, _REMOVE_SIZE)
+        return QSize(option.rect.width(), content_height + 2 * (_ROW_MARGIN + _ROW_PADDING_V))
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        """Paint one file row."""
+        # Stylesheet-driven background, hover and rounded corners
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        name_font, details_font, remove_font = self._fonts(option.font)
+        content = self._content_rect(option.rect)
+        remove_rect = self._remove_rect(option.rect)
+
+        painter.save()
+
+        # Status icon, centered in its padded slot
+        pixmap = _status_pixmap(index.data(FileListModel.StatusRole))
+        icon_x = content.left() + (_STATUS_SLOT - _STATUS_ICON_SIZE) // 2
+        icon_y = content.top() + (content.height() - _STATUS_ICON_SIZE) // 2
+        painter.drawPixmap(icon_x, icon_y, pixmap)
+
+        # Name and details, elided to the space between icon and "×"
+        text_left = content.left() + _STATUS_SLOT + _ROW_SPACING
+        text_width = max(0, remove_rect.left() - _ROW_SPACING - text_left)
+        name_metrics = QFontMetrics(name_font)
+        details_metrics = QFontMetrics(details_font)
+        text_top = content.top() + (content.height() - name_metrics.height()
+                                    - _TEXT_SPACING - details_metrics.height()) // 2
+
+        painter.setFont(name_font)
+        painter.setPen(_theme_color(_NAME_COLORS))
+        name = name_metrics.elidedText(index.data(Qt.ItemDataRole.DisplayRole),
+                                       Qt.TextElideMode.ElideRight, text_width)
+        painter.drawText(QRect(text_left, text_top, text_width, name_metrics.height()),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+
+        painter.setFont(details_font)
+        painter.setPen(_theme_color(_DETAILS_COLORS))
+        details = details_metrics.elidedText(index.data(FileListModel.DetailsRole),
+                                             Qt.TextElideMode.ElideRight, text_width)
+        details_top = text_top + name_metrics.height() + _TEXT_SPACING
+        painter.drawText(QRect(text_left, details_top, text_width, details_metrics.height()),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, details)
+
+        # Remove glyph
+        painter.setFont(remove_font)
+        painter.setPen(_theme_color(_REMOVE_COLORS))
+        painter.drawText(remove_rect, Qt.AlignmentFlag.AlignCenter, "×")
+
+        painter.restore()
+
+    def editorEvent(self, event: QEvent, model: QAbstractListModel,
+                    option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        """Treat a left click on "×" as a request to remove the row."""
+        if event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+            if (event.button() == Qt.MouseButton.LeftButton
+                    and self._remove_rect(option.rect).contains(event.position().toPoint())):
+                if event.type() == QEvent.Type.MouseButtonRelease:
+                    self.remove_clicked.emit(index.data(FileListModel.PathRole))
+                return True
+        return super().editorEvent(event, model, option, index)
+
 
 class FileListWidget(QWidget):
     """
     Widget for displaying and managing the file conversion queue.
 
+    Rows live in a FileListModel and are painted by FileItemDelegate, so
+    no widgets are created per file.
+
     Signals:
+        file_added: Emitted with file path when a file has been analyzed and queued
         file_removed: Emitted with file path when a file is removed
         clear_all: Emitted when all files are cleared
+        count_changed: Emitted with the new get_file_count() whenever it changes
     """
 
+    file_added = pyqtSignal(str)
     file_removed = pyqtSignal(str)
     clear_all = pyqtSignal()
+    count_changed = pyqtSignal(int)
 
     def __init__(self, parent=None):
         """Initialize file list widget."""
         super().__init__(parent)
-        self.file_items = {}  # Map file_path -> QListWidgetItem
-        self.file_metadata = {}  # Map file_path -> metadata dict
+        self.model = FileListModel(self)
+        self._analyzed_count = 0
+        self._analyze_signals = AnalyzeSignals(self)
+        self._analyze_signals.finished.connect(self._on_file_analyzed)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -45,7 +417,7 @@ class FileListWidget(QWidget):
         header_layout = QHBoxLayout()
         header_layout.setSpacing(16)  # 2 × 8pt base
 
-        self.title_label = QLabel("Files to Convert:")
+        self.title_label = QLabel(_TITLE_FORMS[0])
         self.title_label.setObjectName("fileListTitle")
         header_layout.addWidget(self.title_label)
 
@@ -59,11 +431,23 @@ class FileListWidget(QWidget):
 
         layout.addLayout(header_layout)
 
-        # List widget
-        self.list_widget = QListWidget()
-        self.list_widget.setObjectName("fileList")
-        self.list_widget.setSelectionMode(QListWidget.SelectionMode.NoSelection)
-        layout.addWidget(self.list_widget)
+        # List view
+        self.delegate = FileItemDelegate(self)
+        # Queued: the row must not be removed while the view is still
+        # dispatching the click that asked for it
+        self.delegate.remove_clicked.connect(self._on_remove_file,
+                                             Qt.ConnectionType.QueuedConnection)
+
+        self.list_view = QListView()
+        self.list_view.setObjectName("fileList")
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.list_view.setMouseTracking(True)
+        # Every row has the same height, so let Qt skip per-row measurement
+        self.list_view.setUniformItemSizes(True)
+        layout.addWidget(self.list_view)
 
         self.setLayout(layout)
         self._update_title()
@@ -72,108 +456,72 @@ class FileListWidget(QWidget):
         """
         Add files to the queue.
 
+        Each file gets a placeholder row right away and is analyzed on the
+        global thread pool; file_added is emitted once its metadata is in.
+
         Args:
             file_paths: List of file paths to add
         """
-        for file_path in file_paths:
-            if file_path not in self.file_items:
-                self._add_file_item(file_path)
+        new_paths = [path for path in dict.fromkeys(file_paths) if not self.model.contains(path)]
 
-        self._update_title()
+        logger.info("Analyzing %d video(s)", len(new_paths))
+        self.model.append_files(new_paths)
+
+        pool = QThreadPool.globalInstance()
+        for file_path in new_paths:
+            token = self.model.token_of(file_path)
+            pool.start(AnalyzeRunnable(file_path, token, self._analyze_signals))
 
-    def _add_file_item(self, file_path: str):
+    def _on_file_analyzed(self, file_path: str, token: int, metadata: Optional[dict]):
         """
-        Add a single file item to the list.
+        Fill in a placeholder row once its analysis has finished.
 
         Args:
             file_path: Path to the file
+            token: Analysis token of the row the result was started for
+            metadata: Video metadata dictionary, or None if analysis failed
         """
-        # Analyze video
-        logger.info(f"Analyzing video: {file_path}")
-        metadata = VideoAnalyzer.get_video_metadata(file_path)
-
-        if not metadata:
-            logger.error(f"Failed to analyze video: {file_path}")
+        if self.model.token_of(file_path) != token:
+            # Removed (or cleared) while it was being analyzed, and possibly
+            # added again since; the new row has its own analysis running
             return
 
-        # Store metadata
-        self.file_metadata[file_path] = metadata
+        index = self.model.index_of(file_path)
+        if index.data(FileListModel.MetadataRole) is not None:
+            return  # Already filled in; counting it again would skew the count
 
-        # Create list item
-        item = QListWidgetItem()
-        item.setData(Qt.ItemDataRole.UserRole, file_path)
-
-        # Create custom widget for the item
-        item_widget = self._create_file_item_widget(file_path, metadata)
-
-        # Add to list
-        self.list_widget.addItem(item)
-        self.list_widget.setItemWidget(item, item_widget)
-        item.setSizeHint(item_widget.sizeHint())
+        if not metadata:
+            logger.error("Failed to analyze video: %s", file_path)
+            self.model.remove_file(file_path)
+            return
 
-        # Store reference
-        self.file_items[file_path] = item
+        self.model.setData(index, metadata, FileListModel.MetadataRole)
+        self.model.setData(index, self._format_details(metadata), FileListModel.DetailsRole)
+        self._analyzed_count += 1
 
-        logger.info(f"Added file to queue: {file_path}")
+        self._update_title()
+        self.count_changed.emit(self._analyzed_count)
+        self.file_added.emit(file_path)
+        logger.info("Added file to queue: %s", file_path)
 
-    def _create_file_item_widget(self, file_path: str, metadata: dict) -> QWidget:
+    @staticmethod
+    def _format_details(metadata: dict) -> str:
         """
-        Create custom widget for a file item.
+        Build the details line shown under a file's name.
 
         Args:
-            file_path: Path to the file
             metadata: Video metadata dictionary
 
         Returns:
-            QWidget for the list item
+            Resolution, codec, input size and estimated output size
         """
-        widget = QWidget()
-        widget.setStyleSheet("")  # Ensure widget inherits parent styles
-        layout = QHBoxLayout()
-        layout.setContentsMargins(12, 8, 12, 8)  # Apple HIG: comfortable padding
-        layout.setSpacing(12)  # 1.5 × 8pt base
-
-        # Status icon (pending by default)
-        status_label = QLabel("⏸")
-        status_label.setObjectName("statusIcon")
-        status_label.setProperty("status", "pending")
-        layout.addWidget(status_label)
-
-        # File information
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(4)  # Tight spacing for related text
-
-        # File name
-        name_label = QLabel(metadata['file_name'])
-        name_label.setObjectName("fileName")
-        name_label.setWordWrap(False)
-        name_label.setTextFormat(Qt.TextFormat.PlainText)
-        info_layout.addWidget(name_label)
+        from converter.video_analyzer import VideoAnalyzer
 
-        # Details (resolution, size, estimated output)
         resolution_label = VideoAnalyzer.get_resolution_label(metadata)
         input_size = VideoAnalyzer.format_file_size(metadata['file_size_bytes'])
         estimated_output = f"{metadata['estimated_output_size_mb']:.1f} MB"
 
-        details_text = f"{resolution_label} • {metadata['codec']} • {input_size} → ~{estimated_output}"
-        details_label = QLabel(details_text)
-        details_label.setObjectName("fileDetails")
-        details_label.setWordWrap(False)
-        details_label.setTextFormat(Qt.TextFormat.PlainText)
-        info_layout.addWidget(details_label)
-
-        layout.addLayout(info_layout, stretch=1)
-
-        # Remove button
-        remove_button = QPushButton("×")
-        remove_button.setObjectName("removeFileButton")
-        remove_button.setFixedSize(24, 24)
-        remove_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        remove_button.clicked.connect(lambda: self._on_remove_file(file_path))
-        layout.addWidget(remove_button)
-
-        widget.setLayout(layout)
-        return widget
+        return f"{resolution_label} • {metadata['codec']} • {input_size} → ~{estimated_output}"
 
     def _on_remove_file(self, file_path: str):
         """
@@ -182,26 +530,28 @@ class FileListWidget(QWidget):
         Args:
             file_path: Path to the file to remove
         """
-        if file_path in self.file_items:
-            item = self.file_items[file_path]
-            row = self.list_widget.row(item)
-            self.list_widget.takeItem(row)
-
-            del self.file_items[file_path]
-            if file_path in self.file_metadata:
-                del self.file_metadata[file_path]
+        was_analyzed = self.get_file_metadata(file_path) is not None
+        if self.model.remove_file(file_path):
+            if was_analyzed:
+                self._analyzed_count -= 1
+                self.count_changed.emit(self._analyzed_count)
 
             self.file_removed.emit(file_path)
             self._update_title()
-            logger.info(f"Removed file from queue: {file_path}")
+            logger.info("Removed file from queue: %s", file_path)
 
     def _on_clear_all(self):
         """Handle clear all button click."""
-        self.list_widget.clear()
-        self.file_items.clear()
-        self.file_metadata.clear()
-        self.clear_all.emit()
+        # One model reset, not one removal per row
+        self.model.clear()
+        had_files = self._analyzed_count > 0
+        self._analyzed_count = 0
         self._update_title()
+        if had_files:
+            self.count_changed.emit(0)
+
+        # Listeners see the empty queue in one transition
+        self.clear_all.emit()
         logger.info("Cleared all files from queue")
 
     def update_file_status(self, file_path: str, status: str):
@@ -212,47 +562,34 @@ class FileListWidget(QWidget):
             file_path: Path to the file
             status: Status string ("pending", "processing", "completed", "failed")
         """
-        if file_path not in self.file_items:
-            return
+        index = self.model.index_of(file_path)
+        if index.isValid():
+            # Repaints just that row with the pre-rendered icon
+            self.model.setData(index, status, FileListModel.StatusRole)
 
-        item = self.file_items[file_path]
-        widget = self.list_widget.itemWidget(item)
-
-        if widget:
-            # Find status label
-            status_label = widget.findChild(QLabel, "statusIcon")
-            if status_label:
-                # Update icon based on status
-                icons = {
-                    "pending": "⏸",
-                    "processing": "⏳",
-                    "completed": "✓",
-                    "failed": "✗"
-                }
-                status_label.setText(icons.get(status, "⏸"))
-                status_label.setProperty("status", status)
-
-                # Force style refresh
-                status_label.style().unpolish(status_label)
-                status_label.style().polish(status_label)
+    def changeEvent(self, event):
+        """Repaint rows in the new colors when the theme changes."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.StyleChange:
+            self.list_view.viewport().update()
 
     def get_file_count(self) -> int:
         """
         Get the number of files in the queue.
 
         Returns:
-            Number of files
+            Number of analyzed files (rows still being analyzed are excluded)
         """
-        return len(self.file_items)
+        return self._analyzed_count
 
     def get_file_list(self) -> list:
         """
         Get list of all file paths in the queue.
 
         Returns:
-            List of file paths
+            List of analyzed file paths, in display order
         """
-        return list(self.file_items.keys())
+        return [path for path in self.model.paths() if self.get_file_metadata(path) is not None]
 
     def get_file_metadata(self, file_path: str) -> dict:
         """
@@ -264,16 +601,16 @@ class FileListWidget(QWidget):
         Returns:
             Metadata dictionary or None
         """
-        return self.file_metadata.get(file_path)
+        index = self.model.index_of(file_path)
+        return index.data(FileListModel.MetadataRole) if index.isValid() else None
 
     def _update_title(self):
         """Update the title label with file count."""
         count = self.get_file_count()
-        if count == 0:
-            self.title_label.setText("Files to Convert:")
-        elif count == 1:
-            self.title_label.setText("Files to Convert: (1 file)")
-        else:
-            self.title_label.setText(f"Files to Convert: ({count} files)")
-
-        self.clear_button.setEnabled(count > 0)
+        text = _TITLE_FORMS.get(count) or f"Files to Convert: ({count} files)"
+
+        # Skip no-op updates so unchanged labels/buttons aren't repainted
+        if self.title_label.text() != text:
+            self.title_label.setText(text)
+        if self.clear_button.isEnabled() != (count > 0):
+            self.clear_button.setEnabled(count > 0)
@@ -0,0 +1,63 @@
+"""
+Shared cache of decoded and scaled image pixmaps.
+"""
+import os
+from typing import Dict, Tuple
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+
+
+class IconCache:
+    """
+    Process-wide cache of QPixmaps keyed by file path and size.
+
+    Decoding a large PNG and smooth-scaling it is expensive, so each
+    (path, size) combination is built once and shared. Paths are made
+    absolute so callers that spell the same file differently share entries.
+    Requires a QApplication to exist before first use.
+    """
+
+    _originals: Dict[str, QPixmap] = {}
+    _scaled: Dict[Tuple[str, int, int], QPixmap] = {}
+
+    @classmethod
+    def get(cls, path: str) -> QPixmap:
+        """
+        Get the full-size pixmap for an image file.
+
+        Args:
+            path: Path to image file
+
+        Returns:
+            Decoded pixmap (null if the file could not be read)
+        """
+        path = os.path.abspath(path)
+        pixmap = cls._originals.get(path)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            cls._originals[path] = pixmap
+        return pixmap
+
+    @classmethod
+    def get_scaled(cls, path: str, width: int, height: int) -> QPixmap:
+        """
+        Get an image scaled to fit width x height, keeping its aspect ratio.
+
+        Args:
+            path: Path to image file
+            width: Maximum width in pixels
+            height: Maximum height in pixels
+
+        Returns:
+            Smoothly scaled pixmap
+        """
+        key = (os.path.abspath(path), width, height)
+        pixmap = cls._scaled.get(key)
+        if pixmap is None:
+            pixmap = cls.get(path).scaled(
+                width, height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            cls._scaled[key] = pixmap
+        return pixmap
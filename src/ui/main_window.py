@@ -1,29 +1,95 @@
 """
 Main application window.
 """
-import sys
+import logging
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QMessageBox, QLabel
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QElapsedTimer, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from ui.drop_zone import DropZone
 from ui.file_list_widget import FileListWidget
 from ui.progress_widget import ProgressWidget, BatchProgressWidget
 from ui.settings_dialog import SettingsDialog, QuickSettingsWidget
 from ui.about_dialog import AboutDialog
+from ui.icon_cache import IconCache
 from converter.conversion_worker import BatchConversionManager
 from utils.config import config
 from utils.validators import check_ffmpeg_available, validate_conversion_request, parse_ffmpeg_error
 from utils.logger import logger
 
 
+class FFmpegCheckSignals(QObject):
+    """
+    Signals for FFmpegCheckRunnable (QRunnable is not a QObject).
+
+    Signals:
+        result: Emitted with (is_available, message)
+    """
+
+    result = pyqtSignal(bool, str)
+
+
+class FFmpegCheckRunnable(QRunnable):
+    """Run the FFmpeg availability check on a thread pool thread."""
+
+    def __init__(self, signals: FFmpegCheckSignals):
+        """
+        Initialize check task.
+
+        Args:
+            signals: Signals object to report the result through
+        """
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        """Spawn the FFmpeg/ffprobe checks and report the result (delivered on the GUI thread)."""
+        is_available, message = check_ffmpeg_available(deep=True)
+        self.signals.result.emit(is_available, message)
+
+
+class ValidationSignals(QObject):
+    """
+    Signals for ValidationRunnable (QRunnable is not a QObject).
+
+    Signals:
+        finished: Emitted with (file_list, [(file_path, error_message), ...])
+    """
+
+    finished = pyqtSignal(list, list)
+
+
+class ValidationRunnable(QRunnable):
+    """Validate a batch of files for conversion on a thread pool thread."""
+
+    def __init__(self, file_list: List[str], signals: ValidationSignals):
+        """
+        Initialize validation task.
+
+        Args:
+            file_list: Input file paths to validate
+            signals: Signals object to report the result through
+        """
+        super().__init__()
+        self.file_list = file_list
+        self.signals = signals
+
+    def run(self):
+        """Validate every file, collecting all failures rather than stopping at the first."""
+        errors: List[Tuple[str, str]] = []
+        for file_path in self.file_list:
+            is_valid, error_msg = validate_conversion_request(file_path)
+            if not is_valid:
+                errors.append((file_path, error_msg))
+
+        self.signals.finished.emit(self.file_list, errors)
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
@@ -32,26 +98,58 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.conversion_manager = None
         self._is_converting = False
+        self._is_validating = False
+        self._file_count = 0  # Mirrors file_list.get_file_count() via count_changed
+        self._last_button_state: Optional[Tuple[bool, bool, bool]] = None
+        self._settings_dialog: Optional[SettingsDialog] = None  # Built on first open
+        self._about_dialog: Optional[AboutDialog] = None  # Built on first open
+        self._file_list_snapshot: List[str] = []  # Files of the running batch, by index
+        self._failed_files: List[Tuple[str, str]] = []  # (input_file, error) for this batch
+        # Files converting right now (index -> name, start timer and latest
+        # progress, in start order); with a hardware encoder several run at
+        # once, but progress_widget follows one
+        self._running_files: Dict[int, Dict[str, Any]] = {}
+        self._progress_index: Optional[int] = None  # File shown by progress_widget
+        self._initialized = False  # Deferred setup done (see showEvent)
         self._setup_window()
         self._setup_ui()
-        self._check_dependencies()
+
+    def showEvent(self, event):
+        """
+        Finish setup once the window is first shown.
+
+        The icon load and dependency check are deferred until here, and
+        the check is queued behind the first paint, so the window appears
+        before any disk or subprocess work.
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        if self._initialized:
+            return
+        self._initialized = True
+
+        self._load_window_icon()
+        QTimer.singleShot(0, self._check_dependencies)
 
     def _setup_window(self):
         """Set up window properties."""
         self.setWindowTitle(config.APP_NAME)
 
-        # Set application icon
+        # Larger, more spacious window for modern design
+        self.setMinimumSize(900, 700)
+        self.resize(1000, 800)
+
+    def _load_window_icon(self):
+        """Set the window icon from the resources directory."""
         icon_path = Path(__file__).parent.parent / 'resources' / 'app_icon.png'
         if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+            self.setWindowIcon(QIcon(IconCache.get(str(icon_path))))
             logger.info(f"Application icon loaded from: {icon_path}")
         else:
             logger.warning(f"Application icon not found at: {icon_path}")
 
-        # Larger, more spacious window for modern design
-        self.setMinimumSize(900, 700)
-        self.resize(1000, 800)
-
     def _setup_ui(self):
         """Set up the user interface."""
         # Central widget
@@ -70,6 +168,7 @@ class MainWindow(QMainWindow):
 
         # File list
         self.file_list = FileListWidget()
+        self.file_list.count_changed.connect(self._on_file_count_changed)
         self.file_list.file_removed.connect(self._on_file_removed)
         self.file_list.clear_all.connect(self._on_clear_all)
         main_layout.addWidget(self.file_list, stretch=1)
@@ -130,8 +229,23 @@ class MainWindow(QMainWindow):
         logger.info("Main window UI initialized")
 
     def _check_dependencies(self):
-        """Check if required dependencies are available."""
-        is_available, message = check_ffmpeg_available()
+        """Check if required dependencies are available, without blocking the UI."""
+        self.progress_widget.set_status("Checking FFmpeg…")
+
+        self._ffmpeg_check_signals = FFmpegCheckSignals(self)
+        self._ffmpeg_check_signals.result.connect(self._on_ffmpeg_checked)
+        QThreadPool.globalInstance().start(FFmpegCheckRunnable(self._ffmpeg_check_signals))
+
+    def _on_ffmpeg_checked(self, is_available: bool, message: str):
+        """
+        Handle the result of the FFmpeg availability check.
+
+        Args:
+            is_available: Whether FFmpeg and ffprobe were found
+            message: Status or error message from the check
+        """
+        if not self._is_converting:
+            self.progress_widget.set_status("Ready")
 
         if not is_available:
             QMessageBox.critical(
@@ -142,9 +256,10 @@ class MainWindow(QMainWindow):
                 "Visit: https://ffmpeg.org/download.html"
             )
             logger.error("FFmpeg not available")
-            # Disable UI
+            # Disable UI; forget the cached state so a later update reapplies it
             self.drop_zone.set_enabled(False)
             self.start_button.setEnabled(False)
+            self._last_button_state = None
         else:
             logger.info("All dependencies available")
 
@@ -155,7 +270,7 @@ class MainWindow(QMainWindow):
         Args:
             file_paths: List of file paths
         """
-        if self._is_converting:
+        if self._is_converting or self._is_validating:
             QMessageBox.warning(
                 self,
                 "Conversion in Progress",
@@ -168,6 +283,16 @@ class MainWindow(QMainWindow):
 
         logger.info(f"Added {len(file_paths)} files to queue")
 
+    def _on_file_count_changed(self, count: int):
+        """
+        Handle the number of queued (analyzed) files changing.
+
+        Args:
+            count: New number of files in the queue
+        """
+        self._file_count = count
+        self._update_button_states()
+
     def _on_file_removed(self, file_path: str):
         """
         Handle file removed from queue.
@@ -175,12 +300,10 @@ class MainWindow(QMainWindow):
         Args:
             file_path: Path to removed file
         """
-        self._update_button_states()
-        logger.info(f"File removed: {file_path}")
+        logger.info("File removed: %s", file_path)
 
     def _on_clear_all(self):
         """Handle clear all button click."""
-        self._update_button_states()
         logger.info("All files cleared")
 
     def _on_start_conversion(self):
@@ -190,25 +313,50 @@ class MainWindow(QMainWindow):
         if not file_list:
             return
 
-        # Validate all files
-        for file_path in file_list:
-            is_valid, error_msg = validate_conversion_request(file_path)
-            if not is_valid:
-                QMessageBox.critical(
-                    self,
-                    "Validation Error",
-                    f"Cannot convert {Path(file_path).name}:\n{error_msg}"
-                )
-                return
+        # Validate all files off the UI thread; the queue is frozen meanwhile
+        self._is_validating = True
+        self._update_button_states()
+        self.file_list.setEnabled(False)
+        self.progress_widget.set_busy(f"Checking {len(file_list)} file(s)…")
 
-        # Start conversion
+        signals = ValidationSignals(self)
+        signals.finished.connect(self._on_validation_done)
+        QThreadPool.globalInstance().start(ValidationRunnable(file_list, signals))
+
+    def _on_validation_done(self, file_list: list, errors: list):
+        """
+        Start the batch once validation has finished, or report every invalid file.
+
+        Args:
+            file_list: Validated input file paths
+            errors: List of (file_path, error_message) for files that failed
+        """
+        self.sender().deleteLater()
+        self._is_validating = False
+        self.file_list.setEnabled(True)
+        self.progress_widget.reset()
+
+        if errors:
+            logger.warning("Validation failed for %d of %d file(s)", len(errors), len(file_list))
+            self._update_button_states()
+            self._show_validation_errors(errors)
+            return
+
+        # Start conversion; batch signals refer to files by index into this
+        self._file_list_snapshot = file_list
+        self._failed_files = []
+        self._running_files = {}
+        self._progress_index = None
         self._is_converting = True
         self._update_button_states()
 
         # Show batch progress if multiple files
         if len(file_list) > 1:
             self.batch_progress_widget.setVisible(True)
-            self.batch_progress_widget.start_batch(len(file_list))
+            # Weight overall progress by duration so long files count for more
+            durations = [(self.file_list.get_file_metadata(path) or {}).get('duration', 0)
+                         for path in file_list]
+            self.batch_progress_widget.start_batch(len(file_list), durations)
 
         # Create and start conversion manager
         self.conversion_manager = BatchConversionManager(file_list)
@@ -218,11 +366,38 @@ class MainWindow(QMainWindow):
         self.conversion_manager.progress_updated.connect(self._on_progress_updated)
         self.conversion_manager.all_finished.connect(self._on_all_finished)
         self.conversion_manager.batch_cancelled.connect(self._on_batch_cancelled)
+        # Freed once its thread has fully exited, not while run() is returning
+        self.conversion_manager.finished.connect(self.conversion_manager.deleteLater)
 
         self.conversion_manager.start()
 
         logger.info(f"Started batch conversion of {len(file_list)} files")
 
+    def _show_validation_errors(self, errors: List[Tuple[str, str]]):
+        """
+        Show one dialog for all files that failed validation.
+
+        Args:
+            errors: List of (file_path, error_message)
+        """
+        if len(errors) == 1:
+            file_path, error_msg = errors[0]
+            QMessageBox.critical(
+                self,
+                "Validation Error",
+                f"Cannot convert {Path(file_path).name}:\n{error_msg}"
+            )
+            return
+
+        dialog = QMessageBox(self)
+        dialog.setIcon(QMessageBox.Icon.Critical)
+        dialog.setWindowTitle("Validation Error")
+        dialog.setText(f"Cannot convert {len(errors)} files. Remove or fix them and try again.")
+        dialog.setDetailedText("\n\n".join(
+            f"{Path(file_path).name}:\n{error_msg}" for file_path, error_msg in errors
+        ))
+        dialog.exec()
+
     def _on_cancel_conversion(self):
         """Handle cancel conversion button click."""
         if self.conversion_manager and self.conversion_manager.isRunning():
@@ -248,10 +423,16 @@ class MainWindow(QMainWindow):
             input_file: Input file path
         """
         file_name = Path(input_file).name
-        self.progress_widget.start_conversion(file_name)
+        started = QElapsedTimer()
+        started.start()
+        self._running_files[index] = {'name': file_name, 'started': started, 'progress': None}
+        # Concurrent files leave the one already shown (and its timer) alone
+        if self._progress_index is None:
+            self._progress_index = index
+            self.progress_widget.follow_conversion(file_name, started)
         self.file_list.update_file_status(input_file, "processing")
 
-        logger.info(f"Converting file {index + 1}/{total}: {file_name}")
+        logger.info("Converting file %d/%d: %s", index + 1, total, file_name)
 
     def _on_file_finished(self, index: int, total: int, output_file: str):
         """
@@ -262,17 +443,15 @@ class MainWindow(QMainWindow):
             total: Total files
             output_file: Output file path
         """
-        # Find input file for this output
-        for input_file in self.file_list.get_file_list():
-            self.file_list.update_file_status(input_file, "completed")
-            break
+        self.file_list.update_file_status(self._file_list_snapshot[index], "completed")
 
-        self.progress_widget.finish_conversion(success=True)
+        self._finish_progress_file(index, success=True)
 
-        if len(self.file_list.get_file_list()) > 1:
-            self.batch_progress_widget.file_completed()
+        if len(self._file_list_snapshot) > 1:
+            self.batch_progress_widget.file_completed(index)
 
-        logger.info(f"File {index + 1}/{total} completed: {Path(output_file).name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("File %d/%d completed: %s", index + 1, total, Path(output_file).name)
 
     def _on_file_failed(self, index: int, total: int, input_file: str, error: str):
         """
@@ -285,18 +464,38 @@ class MainWindow(QMainWindow):
             error: Error message
         """
         self.file_list.update_file_status(input_file, "failed")
-        self.progress_widget.finish_conversion(success=False)
+        self._finish_progress_file(index, success=False)
 
-        # Parse FFmpeg error for better user feedback
-        user_friendly_error = parse_ffmpeg_error(error)
+        # A failed file is done as far as overall progress is concerned
+        if len(self._file_list_snapshot) > 1:
+            self.batch_progress_widget.update_file_progress(index, 1.0)
 
-        QMessageBox.critical(
-            self,
-            "Conversion Failed",
-            f"Failed to convert:\n{Path(input_file).name}\n\n{user_friendly_error}"
-        )
+        # Reported together when the batch ends, so the batch never waits on a dialog
+        self._failed_files.append((input_file, parse_ffmpeg_error(error)))
+
+        logger.error("File %d/%d failed: %s - %s", index + 1, total, Path(input_file).name, error)
+
+    def _finish_progress_file(self, index: int, success: bool):
+        """
+        Drop a file from the running set, moving progress_widget to the next one.
+
+        Args:
+            index: File index
+            success: Whether the file converted successfully
+        """
+        self._running_files.pop(index, None)
+        if index != self._progress_index:
+            return
 
-        logger.error(f"File {index + 1}/{total} failed: {Path(input_file).name} - {error}")
+        if self._running_files:
+            # Follow the longest-running concurrent file instead, keeping its
+            # own start time and progress so the estimates stay meaningful
+            self._progress_index, running = next(iter(self._running_files.items()))
+            self.progress_widget.follow_conversion(running['name'], running['started'],
+                                                   running['progress'])
+        else:
+            self._progress_index = None
+            self.progress_widget.finish_conversion(success=success)
 
     def _on_progress_updated(self, index: int, progress_data: dict):
         """
@@ -306,29 +505,93 @@ class MainWindow(QMainWindow):
             index: File index
             progress_data: Progress information
         """
-        logger.debug(f"MainWindow received progress: {progress_data}")
-        self.progress_widget.update_progress(progress_data)
+        running = self._running_files.get(index)
+        if running is not None:
+            running['progress'] = progress_data
+
+        # Just stashed by the widget; the display refreshes on its own timer
+        if index == self._progress_index:
+            self.progress_widget.update_progress(progress_data)
+
+        if 'progress' in progress_data and len(self._file_list_snapshot) > 1:
+            self.batch_progress_widget.update_file_progress(index, progress_data['progress'] / 100)
+
+    def _release_conversion_manager(self):
+        """Disconnect the finished batch's manager and drop the reference to it."""
+        manager = self.conversion_manager
+        if manager is None:
+            return
+        self.conversion_manager = None
+
+        connections = (
+            (manager.file_started, self._on_file_started),
+            (manager.file_finished, self._on_file_finished),
+            (manager.file_failed, self._on_file_failed),
+            (manager.progress_updated, self._on_progress_updated),
+            (manager.all_finished, self._on_all_finished),
+            (manager.batch_cancelled, self._on_batch_cancelled),
+        )
+        for signal, slot in connections:
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass  # Already disconnected
 
     def _on_all_finished(self):
         """Handle all conversions finished."""
+        self._release_conversion_manager()
         self._is_converting = False
         self._update_button_states()
 
         self.batch_progress_widget.setVisible(False)
+
+        if self._failed_files:
+            self.progress_widget.set_status("Conversions finished with errors")
+            self._show_conversion_failures()
+            logger.info("Batch finished: %d file(s) failed", len(self._failed_files))
+            return
+
         self.progress_widget.set_status("All conversions completed!")
 
         # Show completion message
         QMessageBox.information(
             self,
             "Conversion Complete",
-            f"All {self.file_list.get_file_count()} files have been converted successfully!\n\n"
+            f"All {self._file_count} files have been converted successfully!\n\n"
             f"Output directory: {config.get_output_directory()}"
         )
 
         logger.info("All conversions completed successfully")
 
+    def _show_conversion_failures(self):
+        """Show one dialog summarizing every file that failed in the batch."""
+        failed = len(self._failed_files)
+        converted = len(self._file_list_snapshot) - failed
+
+        if failed == 1:
+            file_path, error_msg = self._failed_files[0]
+            QMessageBox.critical(
+                self,
+                "Conversion Failed",
+                f"Failed to convert:\n{Path(file_path).name}\n\n{error_msg}"
+            )
+            return
+
+        dialog = QMessageBox(self)
+        dialog.setIcon(QMessageBox.Icon.Critical)
+        dialog.setWindowTitle("Conversion Failed")
+        dialog.setText(
+            f"{failed} files failed to convert ({converted} converted).\n\n"
+            f"Output directory: {config.get_output_directory()}"
+        )
+        dialog.setDetailedText("\n\n".join(
+            f"{Path(file_path).name}:\n{error_msg}" for file_path, error_msg in self._failed_files
+        ))
+        dialog.exec()
+
     def _on_batch_cancelled(self):
         """Handle batch conversion cancelled."""
+        self._release_conversion_manager()
         self._is_converting = False
         self._update_button_states()
 
@@ -339,14 +602,19 @@ class MainWindow(QMainWindow):
 
     def _on_settings_clicked(self):
         """Handle settings button click."""
-        dialog = SettingsDialog(self)
-        dialog.settings_changed.connect(self._on_settings_changed)
-        dialog.exec()
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self)
+            self._settings_dialog.settings_changed.connect(self._on_settings_changed)
+        else:
+            # Discard whatever was left unsaved last time
+            self._settings_dialog.load_from_config()
+        self._settings_dialog.exec()
 
     def _on_about_clicked(self):
         """Handle about button click."""
-        dialog = AboutDialog(self)
-        dialog.exec()
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec()
 
     def _on_settings_changed(self):
         """Handle settings changed."""
@@ -358,11 +626,17 @@ class MainWindow(QMainWindow):
 
     def _update_button_states(self):
         """Update button enabled states based on current state."""
-        has_files = self.file_list.get_file_count() > 0
+        state = (self._file_count > 0, self._is_converting, self._is_validating)
+        if state == self._last_button_state:
+            return
+        self._last_button_state = state
+
+        has_files, is_converting, is_validating = state
+        is_busy = is_converting or is_validating
 
-        self.start_button.setEnabled(has_files and not self._is_converting)
-        self.cancel_button.setEnabled(self._is_converting)
-        self.drop_zone.set_enabled(not self._is_converting)
+        self.start_button.setEnabled(has_files and not is_busy)
+        self.cancel_button.setEnabled(is_converting)
+        self.drop_zone.set_enabled(not is_busy)
 
     def closeEvent(self, event):
         """
@@ -1,17 +1,37 @@
 """
 Progress widget for displaying conversion progress.
 """
-import sys
-import time
-from pathlib import Path
+import logging
+from functools import lru_cache
+from typing import List, Optional
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
-from PyQt6.QtCore import Qt
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from PyQt6.QtCore import Qt, QElapsedTimer, QTimer
 
 from utils.logger import logger
 
+# How often queued progress updates are applied to the display (2 Hz)
+_PROGRESS_FLUSH_INTERVAL_MS = 500
+
+# Time label templates (elapsed, remaining)
+_TIME_FORMAT = "Time: {}"
+_TIME_REMAINING_FORMAT = "Time: {} / {} remaining"
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """
+    Format whole seconds as MM:SS or HH:MM:SS.
+
+    Args:
+        seconds: Non-negative whole seconds
+
+    Returns:
+        Formatted time string
+    """
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
 
 class ProgressWidget(QWidget):
     """Widget for displaying conversion progress with time estimates."""
@@ -19,9 +39,21 @@ class ProgressWidget(QWidget):
     def __init__(self, parent=None):
         """Initialize progress widget."""
         super().__init__(parent)
-        self._start_time = None
+        self._elapsed = QElapsedTimer()  # Monotonic; invalid until a conversion starts
         self._current_progress = 0
         self._last_bitrate_mbps = None  # Track last known bitrate
+        self._last_elapsed_s = -1  # Whole seconds shown in the time label
+        self._speed_text = ""  # Text shown in the speed label
+        self._pending_progress: Optional[dict] = None  # Latest update not yet shown
+
+        # Progress arrives far faster than it is worth repainting; updates
+        # are stashed and the newest one is applied on each tick. The timer
+        # runs from start_conversion() until finish_conversion()/reset().
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(_PROGRESS_FLUSH_INTERVAL_MS)
+        self._flush_timer.setSingleShot(False)
+        self._flush_timer.timeout.connect(self._flush_progress)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -68,20 +100,62 @@ class ProgressWidget(QWidget):
         Args:
             file_name: Name of the file being converted
         """
-        self._start_time = time.time()
+        self._pending_progress = None
+        self._flush_timer.start()  # (Re)starts the pull loop for this file
+        # A fresh timer, so one handed to follow_conversion() is never restarted
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
         self._current_progress = 0
         self._last_bitrate_mbps = None  # Reset bitrate
+        self._last_elapsed_s = -1
+        self._speed_text = ""
 
         self.current_file_label.setText(f"Converting: {file_name}")
+        self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self.time_label.setText("Starting...")
         self.speed_label.setText("")
 
         logger.debug(f"Progress widget started for: {file_name}")
 
+    def follow_conversion(self, file_name: str, started: QElapsedTimer,
+                          progress_data: Optional[dict] = None):
+        """
+        Switch the display to a conversion that is already running.
+
+        Unlike start_conversion(), elapsed time (and so the remaining-time
+        estimate) is measured from when that file actually started, and its
+        last known progress is shown right away instead of 0%.
+
+        Args:
+            file_name: Name of the file being converted
+            started: Timer started when the file's conversion began
+            progress_data: Latest progress update for the file, if any
+        """
+        self._flush_timer.start()
+        self._elapsed = started
+        self._current_progress = 0
+        self._last_bitrate_mbps = None
+        self._last_elapsed_s = -1
+        self._speed_text = ""
+
+        self.current_file_label.setText(f"Converting: {file_name}")
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.time_label.setText("Starting...")
+        self.speed_label.setText("")
+
+        self._pending_progress = progress_data
+        self._flush_progress()
+
+        logger.debug("Progress widget following: %s", file_name)
+
     def update_progress(self, progress_data: dict):
         """
-        Update progress display.
+        Queue a progress update for display.
+
+        Only the latest update is kept; the flush timer picks it up on its
+        next tick, so the bar and labels repaint at most twice a second.
 
         Args:
             progress_data: Dictionary with progress information
@@ -90,14 +164,27 @@ class ProgressWidget(QWidget):
                 - time: Current time in seconds
                 - fps: Frames per second
         """
-        logger.debug(f"ProgressWidget.update_progress called with: {progress_data}")
-
-        # Update progress bar
+        self._pending_progress = progress_data
+        if not self._flush_timer.isActive():
+            # Progress without start_conversion(); start polling anyway
+            self._flush_timer.start()
+
+    def _flush_progress(self):
+        """Apply the latest queued progress update, if one arrived since the last tick."""
+        progress_data = self._pending_progress
+        if progress_data is None:
+            return
+        self._pending_progress = None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"ProgressWidget applying progress: {progress_data}")
+
+        # Update progress bar (only when the whole percentage moved)
         if 'progress' in progress_data:
             progress = int(progress_data['progress'])
-            self._current_progress = progress
-            logger.debug(f"Setting progress bar to: {progress}%")
-            self.progress_bar.setValue(progress)
+            if progress != self._current_progress:
+                self._current_progress = progress
+                self.progress_bar.setValue(progress)
 
         # Update bitrate tracking and display
         if 'bitrate_mbps' in progress_data:
@@ -105,15 +192,20 @@ class ProgressWidget(QWidget):
 
         # Always display bitrate if we have it, regardless of what's in current update
         if self._last_bitrate_mbps is not None:
-            self.speed_label.setText(f"{self._last_bitrate_mbps:.1f} Mbps")
+            self._set_speed_text(f"{self._last_bitrate_mbps:.1f} Mbps")
         elif 'speed' in progress_data:
             # Fallback to speed multiplier if no bitrate available
             speed = progress_data['speed']
-            self.speed_label.setText(f"Speed: {speed:.2f}x")
-
-        # Calculate and display time information
-        if self._start_time and self._current_progress > 0:
-            elapsed = time.time() - self._start_time
+            self._set_speed_text(f"Speed: {speed:.2f}x")
+
+        # Calculate and display time information; the label only shows
+        # whole seconds, so it is rebuilt at most once a second
+        if self._elapsed.isValid() and self._current_progress > 0:
+            elapsed = self._elapsed.elapsed() / 1000.0
+            elapsed_s = int(elapsed)
+            if elapsed_s == self._last_elapsed_s:
+                return
+            self._last_elapsed_s = elapsed_s
             elapsed_str = self._format_time(elapsed)
 
             # Estimate remaining time
@@ -122,9 +214,20 @@ class ProgressWidget(QWidget):
                 remaining = estimated_total - elapsed
                 remaining_str = self._format_time(remaining)
 
-                self.time_label.setText(f"Time: {elapsed_str} / {remaining_str} remaining")
+                self.time_label.setText(_TIME_REMAINING_FORMAT.format(elapsed_str, remaining_str))
             else:
-                self.time_label.setText(f"Time: {elapsed_str}")
+                self.time_label.setText(_TIME_FORMAT.format(elapsed_str))
+
+    def _set_speed_text(self, text: str):
+        """
+        Show text in the speed label, skipping the relayout if it is unchanged.
+
+        Args:
+            text: Speed or bitrate text
+        """
+        if text != self._speed_text:
+            self._speed_text = text
+            self.speed_label.setText(text)
 
     def finish_conversion(self, success: bool = True):
         """
@@ -133,38 +236,61 @@ class ProgressWidget(QWidget):
         Args:
             success: Whether the conversion was successful
         """
+        # Anything still queued is superseded by the final state
+        self._flush_timer.stop()
+        self._pending_progress = None
+
         if success:
             self.progress_bar.setValue(100)
             self.current_file_label.setText("Conversion completed!")
 
-            if self._start_time:
-                elapsed = time.time() - self._start_time
+            if self._elapsed.isValid():
+                elapsed = self._elapsed.elapsed() / 1000.0
                 elapsed_str = self._format_time(elapsed)
                 self.time_label.setText(f"Completed in {elapsed_str}")
             else:
                 self.time_label.setText("Completed")
 
-            self.speed_label.setText("")
+            self._set_speed_text("")
         else:
             self.current_file_label.setText("Conversion failed")
             self.time_label.setText("")
-            self.speed_label.setText("")
+            self._set_speed_text("")
 
         logger.debug(f"Progress widget finished (success={success})")
 
     def reset(self):
         """Reset the progress widget to initial state."""
-        self._start_time = None
+        self._flush_timer.stop()
+        self._pending_progress = None
+        self._elapsed = QElapsedTimer()  # Invalid until a conversion starts
         self._current_progress = 0
         self._last_bitrate_mbps = None  # Reset bitrate
+        self._last_elapsed_s = -1
+        self._speed_text = ""
 
         self.current_file_label.setText("Ready")
+        self.progress_bar.setRange(0, 100)  # Leave busy mode, if set
         self.progress_bar.setValue(0)
         self.time_label.setText("")
         self.speed_label.setText("")
 
         logger.debug("Progress widget reset")
 
+    def set_busy(self, message: str):
+        """
+        Show an indeterminate (busy) progress bar with a status message.
+
+        Cleared by reset() or start_conversion().
+
+        Args:
+            message: Status message to display
+        """
+        self.current_file_label.setText(message)
+        self.progress_bar.setRange(0, 0)
+        self.time_label.setText("")
+        self._set_speed_text("")
+
     def set_status(self, message: str):
         """
         Set a custom status message.
@@ -188,24 +314,27 @@ class ProgressWidget(QWidget):
         if seconds < 0:
             return "00:00"
 
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+        return _format_seconds(int(seconds))
 
 
 class BatchProgressWidget(QWidget):
-    """Widget for displaying batch conversion progress."""
+    """
+    Widget for displaying batch conversion progress.
+
+    Overall progress is weighted per file (by duration, when known), so
+    one long file counts for more than many short ones.
+    """
 
     def __init__(self, parent=None):
         """Initialize batch progress widget."""
         super().__init__(parent)
         self._total_files = 0
         self._completed_files = 0
+        self._weights: List[float] = []
+        self._per_file_progress: List[float] = []  # Fraction done (0-1) per file
+        self._total_weight = 0.0
+        self._done_weight = 0.0  # sum(weight * fraction), kept incrementally
+        self._last_displayed_progress = 0  # Percentage shown by the bar
         self._setup_ui()
 
     def _setup_ui(self):
@@ -228,15 +357,27 @@ class BatchProgressWidget(QWidget):
 
         self.setLayout(layout)
 
-    def start_batch(self, total_files: int):
+    def start_batch(self, total_files: int, weights: Optional[List[float]] = None):
         """
         Start tracking batch progress.
 
         Args:
             total_files: Total number of files to convert
+            weights: Relative size of each file (e.g. duration in seconds).
+                     Files without a positive weight get the average one;
+                     if None, every file counts the same.
         """
+        known = [w for w in (weights or ()) if w > 0]
+        fallback = sum(known) / len(known) if known else 1.0
+        if weights is None:
+            weights = [fallback] * total_files
+
         self._total_files = total_files
         self._completed_files = 0
+        self._weights = [w if w > 0 else fallback for w in weights]
+        self._per_file_progress = [0.0] * total_files
+        self._total_weight = sum(self._weights)
+        self._done_weight = 0.0
         self._update_display()
         logger.debug(f"Batch progress started: {total_files} files")
 
@@ -250,26 +391,60 @@ class BatchProgressWidget(QWidget):
         self._completed_files = completed_files
         self._update_display()
 
-    def file_completed(self):
-        """Increment completed file count."""
-        self._completed_files += 1
+    def update_file_progress(self, index: int, fraction: float):
+        """
+        Update how far one file of the batch has got.
+
+        Args:
+            index: File index in the batch
+            fraction: Portion converted (0-1)
+        """
+        if not 0 <= index < len(self._per_file_progress):
+            return
+
+        fraction = min(max(fraction, 0.0), 1.0)
+        self._done_weight += self._weights[index] * (fraction - self._per_file_progress[index])
+        self._per_file_progress[index] = fraction
         self._update_display()
 
+    def file_completed(self, index: Optional[int] = None):
+        """
+        Increment completed file count.
+
+        Args:
+            index: File index in the batch, to count its full weight as done
+        """
+        self._completed_files += 1
+        if index is not None:
+            self.update_file_progress(index, 1.0)
+        else:
+            self._update_display()
+
     def _update_display(self):
         """Update the display based on current progress."""
         if self._total_files > 0:
-            progress = int((self._completed_files / self._total_files) * 100)
-            self.overall_progress_bar.setValue(progress)
+            if self._total_weight > 0:
+                progress = int(self._done_weight / self._total_weight * 100)
+            else:
+                progress = int((self._completed_files / self._total_files) * 100)
             self.overall_label.setText(
                 f"Overall Progress: {self._completed_files} / {self._total_files} files"
             )
         else:
-            self.overall_progress_bar.setValue(0)
+            progress = 0
             self.overall_label.setText("Overall Progress")
 
+        if progress != self._last_displayed_progress:
+            self._last_displayed_progress = progress
+            self.overall_progress_bar.setValue(progress)
+
     def reset(self):
         """Reset batch progress."""
         self._total_files = 0
         self._completed_files = 0
+        self._weights = []
+        self._per_file_progress = []
+        self._total_weight = 0.0
+        self._done_weight = 0.0
         self._update_display()
         logger.debug("Batch progress reset")
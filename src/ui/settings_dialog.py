@@ -2,28 +2,78 @@
 Settings dialog for conversion options.
 """
 import sys
-from pathlib import Path
+from typing import Callable, Dict, Optional
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QComboBox, QSpinBox, QFileDialog,
     QLineEdit, QGroupBox, QRadioButton, QButtonGroup, QCheckBox,
-    QWidget, QGridLayout
+    QWidget, QGridLayout, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 
 from utils.config import config
 from utils.logger import logger
 
+# Qt6's native folder picker on Windows can take many seconds to enumerate
+# large folders (e.g. OneDrive-backed home directories); use Qt's own there
+if sys.platform == 'win32':
+    _DIRECTORY_DIALOG_OPTIONS = (QFileDialog.Option.ShowDirsOnly
+                                 | QFileDialog.Option.DontUseNativeDialog)
+else:
+    _DIRECTORY_DIALOG_OPTIONS = QFileDialog.Option.ShowDirsOnly
+
+# Applies a theme's stylesheet to the app; set by main.py at startup
+_stylesheet_loader: Optional[Callable[[QApplication, str], None]] = None
+
+
+def register_stylesheet_loader(loader: Callable[[QApplication, str], None]):
+    """
+    Register the function SettingsDialog calls to apply a new theme.
+
+    Args:
+        loader: Callable taking (app, theme) that applies the stylesheet
+    """
+    global _stylesheet_loader
+    _stylesheet_loader = loader
+
+
+class HardwareDetectSignals(QObject):
+    """
+    Signals for HardwareDetectRunnable (QRunnable is not a QObject).
+
+    Signals:
+        finished: Emitted with the detected hardware acceleration type
+    """
+
+    finished = pyqtSignal(str)
+
+
+class HardwareDetectRunnable(QRunnable):
+    """Detect hardware acceleration (runs FFmpeg) on a thread pool thread."""
+
+    def __init__(self, signals: Optional[HardwareDetectSignals] = None):
+        """
+        Initialize detection task.
+
+        Args:
+            signals: Signals object to report the result through, if any
+        """
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        """Detect (or wait for a detection already running) and report the result."""
+        detected_hw = config.detect_hardware_acceleration()
+        if self.signals is not None:
+            self.signals.finished.emit(detected_hw)
+
 
 class SettingsDialog(QDialog):
     """
     Dialog for configuring conversion settings.
 
     Signals:
-        settings_changed: Emitted when settings are saved
+        settings_changed: Emitted when saving changed any setting
     """
 
     settings_changed = pyqtSignal()
@@ -38,7 +88,7 @@ class SettingsDialog(QDialog):
         self.resize(1500, 600)
         self.setFixedHeight(600)  # Fixed height - no scrolling needed
         self._setup_ui()
-        self._load_current_settings()
+        self.load_from_config()
 
     def _setup_ui(self):
         """Set up the UI components."""
@@ -65,10 +115,11 @@ class SettingsDialog(QDialog):
         preset_layout.setContentsMargins(16, 16, 16, 16)
 
         self.preset_button_group = QButtonGroup()
+        self._preset_radios: Dict[str, QRadioButton] = {}
+        self._radio_preset_ids: Dict[QRadioButton, str] = {}
 
-        for preset_id, preset_data in config.QUALITY_PRESETS.items():
+        for preset_id, preset_data in config.QUALITY_PRESET_ITEMS:
             radio = QRadioButton(preset_data['name'])
-            radio.setProperty("preset_id", preset_id)
             radio.setMinimumWidth(350)  # Ensure text doesn't wrap
 
             # Add description as tooltip
@@ -77,6 +128,8 @@ class SettingsDialog(QDialog):
             radio.setToolTip(description)
 
             self.preset_button_group.addButton(radio)
+            self._preset_radios[preset_id] = radio
+            self._radio_preset_ids[radio] = preset_id
             preset_layout.addWidget(radio)
 
         preset_group.setLayout(preset_layout)
@@ -91,19 +144,23 @@ class SettingsDialog(QDialog):
 
         # Theme selection
         self.theme_button_group = QButtonGroup()
+        self._theme_radios: Dict[str, QRadioButton] = {}
+        self._radio_theme_ids: Dict[QRadioButton, str] = {}
 
         light_radio = QRadioButton("☀️  Light Mode")
-        light_radio.setProperty("theme_id", "light")
         light_radio.setToolTip("Classic light theme with bright colors")
         light_radio.setMinimumWidth(200)  # Ensure text doesn't wrap
         self.theme_button_group.addButton(light_radio)
+        self._theme_radios["light"] = light_radio
+        self._radio_theme_ids[light_radio] = "light"
         appearance_layout.addWidget(light_radio)
 
         dark_radio = QRadioButton("🌙  Dark Mode")
-        dark_radio.setProperty("theme_id", "dark")
         dark_radio.setToolTip("Modern dark theme, easier on the eyes")
         dark_radio.setMinimumWidth(200)  # Ensure text doesn't wrap
         self.theme_button_group.addButton(dark_radio)
+        self._theme_radios["dark"] = dark_radio
+        self._radio_theme_ids[dark_radio] = "dark"
         appearance_layout.addWidget(dark_radio)
 
         # Spacer before note
@@ -137,11 +194,8 @@ class SettingsDialog(QDialog):
         self.gpu_checkbox.setMinimumWidth(300)  # Ensure text doesn't wrap
         hardware_layout.addWidget(self.gpu_checkbox)
 
-        # Detection info
-        detected_hw = config.detect_hardware_acceleration()
-        hw_name = config.HARDWARE_ACCELERATION.get(detected_hw, {}).get('name', 'None')
-
-        self.hw_info_label = QLabel(f"Detected: {hw_name}")
+        # Detection info (normally detected in the background by now)
+        self.hw_info_label = QLabel()
         self.hw_info_label.setObjectName("infoLabel")
         hardware_layout.addWidget(self.hw_info_label)
 
@@ -149,13 +203,19 @@ class SettingsDialog(QDialog):
         hardware_layout.addSpacing(8)
 
         # GPU note
-        if detected_hw != 'none':
-            gpu_note = QLabel("GPU encoding is 5-10x faster but may have slightly lower quality.")
+        self.gpu_note = QLabel()
+        self.gpu_note.setObjectName("noteLabel")
+        self.gpu_note.setWordWrap(True)
+        hardware_layout.addWidget(self.gpu_note)
+
+        detected_hw = config.get_detected_hardware_acceleration()
+        if detected_hw is not None:
+            self._on_hardware_detected(detected_hw)
         else:
-            gpu_note = QLabel("No GPU acceleration available. Using CPU encoding.")
-        gpu_note.setObjectName("noteLabel")
-        gpu_note.setWordWrap(True)
-        hardware_layout.addWidget(gpu_note)
+            self.hw_info_label.setText("Detected: Detecting…")
+            self._hw_detect_signals = HardwareDetectSignals(self)
+            self._hw_detect_signals.finished.connect(self._on_hardware_detected)
+            QThreadPool.globalInstance().start(HardwareDetectRunnable(self._hw_detect_signals))
 
         hardware_group.setLayout(hardware_layout)
         col2_layout.addWidget(hardware_group)
@@ -260,21 +320,39 @@ class SettingsDialog(QDialog):
 
         self.setLayout(main_layout)
 
-    def _load_current_settings(self):
-        """Load current settings from config."""
-        # Set quality preset
-        for button in self.preset_button_group.buttons():
-            preset_id = button.property("preset_id")
-            if preset_id == config.current_preset:
-                button.setChecked(True)
-                break
-
-        # Set theme
-        for button in self.theme_button_group.buttons():
-            theme_id = button.property("theme_id")
-            if theme_id == config.theme:
-                button.setChecked(True)
-                break
+    @pyqtSlot(str)
+    def _on_hardware_detected(self, detected_hw: str):
+        """
+        Show the detected hardware acceleration.
+
+        Args:
+            detected_hw: Hardware acceleration type ('nvenc', 'vaapi', or 'none')
+        """
+        hw_name = config.HARDWARE_ACCELERATION.get(detected_hw, {}).get('name', 'None')
+        self.hw_info_label.setText(f"Detected: {hw_name}")
+
+        if detected_hw != 'none':
+            self.gpu_note.setText("GPU encoding is 5-10x faster but may have slightly lower quality.")
+        else:
+            self.gpu_note.setText("No GPU acceleration available. Using CPU encoding.")
+
+    def load_from_config(self):
+        """Load current settings from config (call before re-showing the dialog)."""
+        # Set quality preset and theme; the groups' toggle signals would
+        # fire for the old and new button, and nothing needs them here
+        self.preset_button_group.blockSignals(True)
+        self.theme_button_group.blockSignals(True)
+        try:
+            preset_radio = self._preset_radios.get(config.current_preset)
+            if preset_radio is not None:
+                preset_radio.setChecked(True)
+
+            theme_radio = self._theme_radios.get(config.theme)
+            if theme_radio is not None:
+                theme_radio.setChecked(True)
+        finally:
+            self.preset_button_group.blockSignals(False)
+            self.theme_button_group.blockSignals(False)
 
         # Set GPU acceleration
         self.gpu_checkbox.setChecked(config.use_gpu)
@@ -288,53 +366,60 @@ class SettingsDialog(QDialog):
         # Set output directory
         self.output_dir_edit.setText(config.output_directory)
 
+    @pyqtSlot()
     def _on_browse_directory(self):
         """Handle browse directory button click."""
         directory = QFileDialog.getExistingDirectory(
             self,
             "Select Output Directory",
-            config.output_directory
+            config.output_directory,
+            _DIRECTORY_DIALOG_OPTIONS
         )
 
         if directory:
             self.output_dir_edit.setText(directory)
-            logger.debug(f"Selected output directory: {directory}")
+            logger.debug("Selected output directory: %s", directory)
 
+    @staticmethod
+    def _settings_snapshot() -> tuple:
+        """Return the config values this dialog edits, for change detection."""
+        return (config.current_preset, config.theme, config.use_gpu,
+                config.custom_crf, config.output_directory)
+
+    @pyqtSlot()
     def _on_save(self):
         """Handle save button click."""
+        old_settings = self._settings_snapshot()
+
         # Save quality preset
-        for button in self.preset_button_group.buttons():
-            if button.isChecked():
-                preset_id = button.property("preset_id")
-                config.set_quality_preset(preset_id)
-                logger.info(f"Quality preset set to: {preset_id}")
-                break
+        preset_radio = self.preset_button_group.checkedButton()
+        if preset_radio is not None:
+            preset_id = self._radio_preset_ids[preset_radio]
+            config.set_quality_preset(preset_id)
+            logger.info("Quality preset set to: %s", preset_id)
 
         # Save theme preference
-        for button in self.theme_button_group.buttons():
-            if button.isChecked():
-                theme_id = button.property("theme_id")
-                old_theme = config.theme
-                config.theme = theme_id
-                logger.info(f"Theme set to: {theme_id}")
-
-                # Reload stylesheet if theme changed
-                if old_theme != theme_id:
-                    from PyQt6.QtWidgets import QApplication
-                    from main import load_stylesheet
-                    load_stylesheet(QApplication.instance(), theme_id)
-                    logger.info(f"Theme switched from {old_theme} to {theme_id}")
-                break
+        theme_radio = self.theme_button_group.checkedButton()
+        if theme_radio is not None:
+            theme_id = self._radio_theme_ids[theme_radio]
+            old_theme = config.theme
+            config.theme = theme_id
+            logger.info("Theme set to: %s", theme_id)
+
+            # Reload stylesheet if theme changed
+            if old_theme != theme_id and _stylesheet_loader is not None:
+                _stylesheet_loader(QApplication.instance(), theme_id)
+                logger.info("Theme switched from %s to %s", old_theme, theme_id)
 
         # Save GPU acceleration setting
         config.use_gpu = self.gpu_checkbox.isChecked()
-        logger.info(f"GPU acceleration: {'enabled' if config.use_gpu else 'disabled'}")
+        logger.info("GPU acceleration: %s", 'enabled' if config.use_gpu else 'disabled')
 
         # Save custom CRF
         crf_value = self.crf_spinbox.value()
         if crf_value > 0:
             config.set_custom_crf(crf_value)
-            logger.info(f"Custom CRF set to: {crf_value}")
+            logger.info("Custom CRF set to: %s", crf_value)
         else:
             config.reset_custom_settings()
             logger.info("Using preset CRF values")
@@ -343,9 +428,10 @@ class SettingsDialog(QDialog):
         output_dir = self.output_dir_edit.text()
         if output_dir:
             config.set_output_directory(output_dir)
-            logger.info(f"Output directory set to: {output_dir}")
+            logger.info("Output directory set to: %s", output_dir)
 
-        self.settings_changed.emit()
+        if self._settings_snapshot() != old_settings:
+            self.settings_changed.emit()
         self.accept()
 
 
@@ -372,12 +458,12 @@ class QuickSettingsWidget(QGroupBox):
         layout.addWidget(preset_label)
 
         self.preset_combo = QComboBox()
-        for preset_id, preset_data in config.QUALITY_PRESETS.items():
+        self._preset_index: Dict[str, int] = {}  # Map preset_id -> combo index
+        for index, (preset_id, preset_data) in enumerate(config.QUALITY_PRESET_ITEMS):
             self.preset_combo.addItem(preset_data['name'], preset_id)
+            self._preset_index[preset_id] = index
 
-        self.preset_combo.setCurrentText(
-            config.QUALITY_PRESETS[config.current_preset]['name']
-        )
+        self.preset_combo.setCurrentIndex(self._preset_index.get(config.current_preset, 0))
         self.preset_combo.currentIndexChanged.connect(self._on_preset_changed)
         layout.addWidget(self.preset_combo)
 
@@ -391,14 +477,14 @@ class QuickSettingsWidget(QGroupBox):
 
         self.setLayout(layout)
 
+    @pyqtSlot(int)
     def _on_preset_changed(self, index):
         """Handle preset selection change."""
         preset_id = self.preset_combo.itemData(index)
         if preset_id:
             config.set_quality_preset(preset_id)
-            logger.info(f"Quality preset changed to: {preset_id}")
+            logger.info("Quality preset changed to: %s", preset_id)
 
     def update_from_config(self):
         """Update widget to reflect current config."""
-        preset_name = config.QUALITY_PRESETS[config.current_preset]['name']
-        self.preset_combo.setCurrentText(preset_name)
+        self.preset_combo.setCurrentIndex(self._preset_index.get(config.current_preset, 0))
@@ -2,20 +2,34 @@
 Application configuration and settings.
 """
 import os
+import re
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Set, Tuple
+
+# Hardware H.264 encoders in `ffmpeg -encoders` output
+_HW_ENCODER_RE = re.compile(rb'\bh264_(nvenc|vaapi)\b')
 
 
 class Config:
     """Application configuration manager."""
 
+    # Instance attributes; everything else on the class is a shared constant
+    __slots__ = (
+        'config_dir', 'output_directory', 'current_preset',
+        'custom_crf', 'custom_preset', 'hardware_accel', '_use_gpu', 'theme',
+        '_hw_accel_cache', '_hw_accel_lock', '_cmd_prefix', '_cmd_suffix',
+    )
+
     # Application info
     APP_NAME = "FrameConverter"
     APP_VERSION = "1.0.0"
     ORGANIZATION = "Kyron Industries"
 
-    # Quality presets optimized for DaVinci Resolve (based on 2025 research)
-    QUALITY_PRESETS = {
+    # Quality presets optimized for DaVinci Resolve (based on 2025 research).
+    # Read-only; QUALITY_PRESET_ITEMS is the same in display order.
+    QUALITY_PRESETS = MappingProxyType({
         "fast": {
             "name": "Fast",
             "preset": "faster",
@@ -46,10 +60,11 @@ class Config:
             "crf": 23,
             "description": "Hardware accelerated, very fast"
         }
-    }
+    })
+    QUALITY_PRESET_ITEMS = tuple(QUALITY_PRESETS.items())
 
-    # Hardware acceleration options
-    HARDWARE_ACCELERATION = {
+    # Hardware acceleration options (read-only)
+    HARDWARE_ACCELERATION = MappingProxyType({
         "nvenc": {
             "name": "NVIDIA NVENC",
             "encoder": "h264_nvenc",
@@ -65,7 +80,7 @@ class Config:
             "encoder": "libx264",
             "check_cmd": None
         }
-    }
+    })
 
     # Default conversion settings (as per PROJECT_PLAN.md)
     DEFAULT_VIDEO_CODEC = "libx264"
@@ -79,9 +94,14 @@ class Config:
     FFMPEG_BINARY = "ffmpeg"
     FFPROBE_BINARY = "ffprobe"
 
+    # Batch conversion: files converted at once with a hardware encoder.
+    # Software (libx264) encoding already uses every core, so it stays serial.
+    MAX_CONCURRENT_HW_CONVERSIONS = 3
+
     # File validation
     SUPPORTED_INPUT_FORMATS = [".mp4"]
     OUTPUT_FORMAT = ".mov"
+    DISK_SPACE_SAFETY_FACTOR = 1.05  # Free space required, relative to the size estimate
 
     # UI settings
     WINDOW_MIN_WIDTH = 800
@@ -100,33 +120,73 @@ class Config:
         "drop_zone": "#E8F4F8"     # Light blue tint
     }
 
+    # Directories already created this process, shared by all instances so
+    # repeat conversions skip the makedirs/stat round trip
+    _created_dirs: Set[str] = set()
+
     def __init__(self):
         """Initialize configuration with user preferences."""
-        self.config_dir = Path.home() / '.video-converter'
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        home = os.path.expanduser('~')
+        self.config_dir: Path = Path(self.ensure_directory(os.path.join(home, '.video-converter')))
 
         # Default output directory
-        self.output_directory = str(Path.home() / 'Videos' / 'Converted')
+        self.output_directory: str = os.path.join(home, 'Videos', 'Converted')
 
         # Current quality preset
-        self.current_preset = "high"
+        self.current_preset: str = "high"
 
         # Advanced settings
-        self.custom_crf = None  # If set, overrides preset CRF
-        self.custom_preset = None  # If set, overrides preset
+        self.custom_crf: Optional[int] = None  # If set, overrides preset CRF
+        self.custom_preset: Optional[str] = None  # If set, overrides preset
 
         # Hardware acceleration
-        self.hardware_accel = None  # Will be auto-detected
-        self.use_gpu = False  # Enable GPU acceleration if available
+        self.hardware_accel: Optional[str] = None  # Will be auto-detected
+        self._use_gpu: bool = False  # Enable GPU acceleration if available
 
         # Theme preference
-        self.theme = "light"  # Options: "light" or "dark"
+        self.theme: str = "light"  # Options: "light" or "dark"
+
+        # Result of detect_hardware_acceleration(); the encoder list can't
+        # change while the app runs, so FFmpeg is only asked once. The lock
+        # makes callers on other threads wait for a probe already running.
+        self._hw_accel_cache: Optional[str] = None
+        self._hw_accel_lock = threading.Lock()
+
+        # FFmpeg arguments around the input/output paths, built on first use
+        # and again after any setting that changes them
+        self._cmd_prefix: Optional[Tuple[str, ...]] = None
+        self._cmd_suffix: Optional[Tuple[str, ...]] = None
+
+    @property
+    def use_gpu(self) -> bool:
+        """Whether to encode with hardware acceleration if available."""
+        return self._use_gpu
+
+    @use_gpu.setter
+    def use_gpu(self, enabled: bool):
+        self._use_gpu = enabled
+        self._cmd_prefix = None
+
+    @classmethod
+    def ensure_directory(cls, directory: str) -> str:
+        """
+        Create a directory if it hasn't already been created this process.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            The directory path, normalized
+        """
+        directory = os.path.normpath(directory)
+        if directory not in cls._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            cls._created_dirs.add(directory)
+        return directory
 
     def get_output_directory(self) -> str:
         """Get the output directory, creating it if needed."""
-        output_path = Path(self.output_directory)
-        output_path.mkdir(parents=True, exist_ok=True)
-        return str(output_path)
+        return self.ensure_directory(self.output_directory)
 
     def set_output_directory(self, directory: str):
         """Set the output directory."""
@@ -159,101 +219,145 @@ class Config:
         """Set the current quality preset."""
         if preset_name in self.QUALITY_PRESETS:
             self.current_preset = preset_name
+            self._cmd_prefix = None
 
     def set_custom_crf(self, crf: int):
         """Set custom CRF value (0-51)."""
         if 0 <= crf <= 51:
             self.custom_crf = crf
+            self._cmd_prefix = None
 
     def reset_custom_settings(self):
         """Reset custom settings to use presets."""
         self.custom_crf = None
         self.custom_preset = None
+        self._cmd_prefix = None
 
     def detect_hardware_acceleration(self) -> str:
         """
         Detect available hardware acceleration.
 
+        The result is cached for the life of the process. The first call
+        runs FFmpeg and may block; it is started in the background at
+        application startup.
+
+        Returns:
+            Hardware acceleration type ('nvenc', 'vaapi', or 'none')
+        """
+        if self._hw_accel_cache is not None:
+            return self._hw_accel_cache
+
+        with self._hw_accel_lock:
+            if self._hw_accel_cache is None:
+                self._hw_accel_cache = self._probe_hardware_acceleration()
+        return self._hw_accel_cache
+
+    def get_detected_hardware_acceleration(self) -> Optional[str]:
+        """
+        Get the hardware acceleration type if it has already been detected.
+
+        Returns:
+            Hardware acceleration type, or None if detection hasn't finished
+        """
+        return self._hw_accel_cache
+
+    def _probe_hardware_acceleration(self) -> str:
+        """
+        Ask FFmpeg which hardware encoders it supports.
+
         Returns:
             Hardware acceleration type ('nvenc', 'vaapi', or 'none')
         """
         import subprocess
 
-        # Check for NVENC
+        detected = 'none'
         try:
             result = subprocess.run(
-                ['ffmpeg', '-encoders'],
+                ['ffmpeg', '-hide_banner', '-v', 'error', '-encoders'],
                 capture_output=True,
-                text=True,
                 timeout=5
             )
-            if 'h264_nvenc' in result.stdout:
-                return 'nvenc'
-            elif 'h264_vaapi' in result.stdout:
-                return 'vaapi'
-        except:
+            found = set(_HW_ENCODER_RE.findall(result.stdout))
+            # NVENC is preferred when both are present
+            for accel in ('nvenc', 'vaapi'):
+                if accel.encode() in found:
+                    detected = accel
+                    break
+        except Exception:
             pass
 
-        return 'none'
+        return detected
 
-    def get_ffmpeg_command_args(self, input_file: str, output_file: str) -> list:
+    def get_video_encoder(self) -> str:
         """
-        Build FFmpeg command arguments based on current settings.
-        Now includes DaVinci Resolve optimizations and GPU acceleration.
-
-        Args:
-            input_file: Input video file path
-            output_file: Output video file path
+        Get the video encoder FFmpeg will use with the current settings.
 
         Returns:
-            List of command arguments
+            Encoder name (e.g. 'libx264' or 'h264_nvenc')
         """
-        settings = self.get_preset_settings()
-        preset_config = self.QUALITY_PRESETS.get(self.current_preset, self.QUALITY_PRESETS["high"])
-
         # Auto-detect hardware acceleration if not set
         if self.hardware_accel is None:
             self.hardware_accel = self.detect_hardware_acceleration()
 
         # Use GPU if enabled and available
         if self.use_gpu and self.hardware_accel != 'none':
-            encoder = self.HARDWARE_ACCELERATION[self.hardware_accel]['encoder']
-        else:
-            encoder = settings['video_codec']
+            return self.HARDWARE_ACCELERATION[self.hardware_accel]['encoder']
+
+        return self.DEFAULT_VIDEO_CODEC
+
+    def _rebuild_cmd_template(self):
+        """Build the FFmpeg arguments that don't depend on the file paths."""
+        # Same values as get_preset_settings(), from a single preset lookup
+        preset_config = self.QUALITY_PRESETS.get(self.current_preset, self.QUALITY_PRESETS["high"])
+        preset = self.custom_preset or preset_config["preset"]
+        crf = str(self.custom_crf or preset_config["crf"])
+        encoder = self.get_video_encoder()
 
-        cmd = [
-            self.FFMPEG_BINARY,
-            '-i', input_file,
-            '-c:v', encoder,
-            '-preset', settings['preset'],
-        ]
+        prefix = ['-c:v', encoder, '-preset', preset]
 
         # Add CRF for software encoding, or quality for hardware encoding
         if encoder == 'libx264':
-            cmd.extend(['-crf', str(settings['crf'])])
+            prefix.extend(['-crf', crf])
             # Add DaVinci Resolve optimizations (from research)
             if 'tune' in preset_config:
-                cmd.extend(['-tune', preset_config['tune']])
+                prefix.extend(['-tune', preset_config['tune']])
             if 'gop' in preset_config:
-                cmd.extend(['-g', str(preset_config['gop'])])
+                prefix.extend(['-g', str(preset_config['gop'])])
             # Force yuv420p for compatibility
-            cmd.extend(['-pix_fmt', 'yuv420p'])
+            prefix.extend(['-pix_fmt', 'yuv420p'])
         elif encoder == 'h264_nvenc':
-            cmd.extend(['-cq', str(settings['crf'])])  # NVENC uses -cq instead of -crf
-            cmd.extend(['-rc', 'vbr'])  # Variable bitrate
+            prefix.extend(['-cq', crf])  # NVENC uses -cq instead of -crf
+            prefix.extend(['-rc', 'vbr'])  # Variable bitrate
         elif encoder == 'h264_vaapi':
-            cmd.extend(['-qp', str(settings['crf'])])  # VAAPI uses -qp
+            prefix.extend(['-qp', crf])  # VAAPI uses -qp
+
+        self._cmd_prefix = tuple(prefix)
 
         # Audio settings
-        cmd.extend([
-            '-c:a', settings['audio_codec'],
-            '-b:a', settings['audio_bitrate'],
+        self._cmd_suffix = (
+            '-c:a', self.DEFAULT_AUDIO_CODEC,
+            '-b:a', self.DEFAULT_AUDIO_BITRATE,
             '-movflags', '+faststart',
             '-progress', 'pipe:1',
-            '-y', output_file
-        ])
+            '-y',
+        )
+
+    def get_ffmpeg_command_args(self, input_file: str, output_file: str) -> Tuple[str, ...]:
+        """
+        Build FFmpeg command arguments based on current settings.
+        Now includes DaVinci Resolve optimizations and GPU acceleration.
+
+        Args:
+            input_file: Input video file path
+            output_file: Output video file path
+
+        Returns:
+            Tuple of command arguments
+        """
+        if self._cmd_prefix is None:
+            self._rebuild_cmd_template()
 
-        return cmd
+        return (self.FFMPEG_BINARY, '-i', input_file, *self._cmd_prefix, *self._cmd_suffix, output_file)
 
 
 # Global configuration instance
@@ -1,15 +1,23 @@
 """
 Logging configuration for Video Converter application.
 """
+import atexit
 import logging
+import logging.handlers
 import os
-from pathlib import Path
+import queue
+
+from .config import Config
 
 
 def setup_logger(name: str = "VideoConverter", log_file: str = None) -> logging.Logger:
     """
     Set up application logger with console and file handlers.
 
+    The handlers run on a QueueListener thread; the logger itself only has
+    a QueueHandler, so logging calls on the GUI or conversion threads
+    never wait on console or disk writes.
+
     Args:
         name: Logger name
         log_file: Optional log file path. If None, creates logs directory in home
@@ -34,19 +42,28 @@ def setup_logger(name: str = "VideoConverter", log_file: str = None) -> logging.
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # File handler (DEBUG and above)
     if log_file is None:
         # Create logs directory in user's home
-        log_dir = Path.home() / '.video-converter' / 'logs'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / 'video_converter.log'
+        log_dir = Config.ensure_directory(
+            os.path.join(os.path.expanduser('~'), '.video-converter', 'logs')
+        )
+        log_file = os.path.join(log_dir, 'video_converter.log')
 
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # Hand records to a background thread that runs the real handlers
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Flush what's queued on exit
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     logger.info(f"Logger initialized. Log file: {log_file}")
 
@@ -2,12 +2,65 @@
 File validation utilities with security hardening.
 """
 import os
+import re
 import shutil
+import stat
+import subprocess
+from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from .config import config
 from .logger import logger
 
+# Lowercased input extensions, for O(1) membership tests
+_SUPPORTED_EXT = frozenset(ext.lower() for ext in config.SUPPORTED_INPUT_FORMATS)
+
+# Shown when a file's extension isn't supported
+_SUPPORTED_STR = ", ".join(config.SUPPORTED_INPUT_FORMATS)
+
+# Smallest input accepted as a video (1 KB); anything below is likely corrupted
+_MIN_FILE_SIZE = 1024
+
+# Successful check_ffmpeg_available() results by (ffmpeg, ffprobe, deep);
+# failures are not stored, so installing FFmpeg is noticed on the next check
+_ffmpeg_check_cache: Dict[Tuple[str, str, bool], Tuple[bool, str]] = {}
+
+# Phrases parse_ffmpeg_error looks for, one group each, matched in one
+# case-insensitive pass
+_FFMPEG_ERROR_RE = re.compile(
+    r"(no such file or directory)"              # 1
+    r"|(permission denied)"                     # 2
+    r"|(invalid data|invalid argument)"         # 3
+    r"|(codec not found|unknown encoder)"       # 4
+    r"|(disk full|no space left)"               # 5
+    r"|(out of memory|cannot allocate memory)"  # 6
+    r"|(could not open)"                        # 7
+    r"|(output)"                                # 8
+    r"|(timeout)",                              # 9
+    re.IGNORECASE
+)
+
+# (groups that must all match, message), in priority order
+_FFMPEG_ERROR_MESSAGES = (
+    ({1}, "File not found.\n\n"
+          "The input file may have been moved or deleted during conversion."),
+    ({2}, "Permission denied.\n\n"
+          "The file may be locked by another program or you don't have permission to access it."),
+    ({3}, "Invalid or corrupted video file.\n\n"
+          "The file may be damaged or in an unsupported format."),
+    ({4}, "Required video codec not available.\n\n"
+          "Your FFmpeg installation may be missing required codecs."),
+    ({5}, "Not enough disk space.\n\n"
+          "Free up some disk space and try again."),
+    ({6}, "Out of memory.\n\n"
+          "Close some applications and try again."),
+    ({7, 8}, "Cannot create output file.\n\n"
+             "Check that the output directory is writable and has enough space."),
+    ({9}, "Conversion timeout.\n\n"
+          "The file may be too large or complex to convert."),
+)
+
 
 def sanitize_path(file_path: str) -> str:
     """
@@ -32,7 +85,7 @@ def sanitize_path(file_path: str) -> str:
     for pattern in dangerous_patterns:
         if pattern in file_path and pattern not in path_str:
             # The resolve() removed a suspicious pattern
-            logger.warning(f"Suspicious path pattern detected and sanitized: {file_path}")
+            logger.warning("Suspicious path pattern detected and sanitized: %s", file_path)
 
     return str(path)
 
@@ -47,54 +100,188 @@ def is_valid_video_file(file_path: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    is_valid, message, _ = check_video_file(file_path)
+    return is_valid, message
+
+
+def check_video_file(file_path: str) -> Tuple[bool, str, Optional[os.stat_result]]:
+    """
+    Check if file is a valid video file, also returning its stat result.
+
+    Callers that need the file's size or mtime can use the returned stat
+    instead of statting the file again.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Tuple of (is_valid, error_message, stat result or None if the
+        file wasn't statted)
+    """
     if not file_path:
-        return False, "No file path provided"
+        return False, "No file path provided", None
 
     # Sanitize path to prevent directory traversal
     try:
         file_path = sanitize_path(file_path)
     except Exception as e:
-        logger.error(f"Path sanitization failed: {e}")
-        return False, "Invalid file path"
+        logger.error("Path sanitization failed: %s", e)
+        return False, "Invalid file path", None
 
-    path = Path(file_path)
+    # The extension check needs no filesystem access, so it goes first
+    format_error = _unsupported_format(file_path)
+    if format_error is not None:
+        return False, format_error, None
+
+    # One stat answers existence, file type and size
+    try:
+        st = os.stat(file_path)
+    except OSError as e:
+        return _stat_failure(file_path, e)
+
+    return _check_video_stat(file_path, st)
+
+
+def is_valid_video_files_batch(paths: List[str]) -> Dict[str, Tuple[bool, str]]:
+    """
+    Check many files at once, reading each parent directory only once.
+
+    Gives the same results as calling is_valid_video_file() on each path,
+    but takes file metadata from one os.scandir() per directory (free on
+    Windows, where a per-file stat has to open the file).
+
+    Args:
+        paths: Paths to check
+
+    Returns:
+        Mapping of each path to (is_valid, error_message)
+    """
+    results: Dict[str, Tuple[bool, str]] = {}
+    by_directory: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+
+    for file_path in paths:
+        if not file_path:
+            results[file_path] = (False, "No file path provided")
+            continue
+        try:
+            sanitized = sanitize_path(file_path)
+        except Exception as e:
+            logger.error("Path sanitization failed: %s", e)
+            results[file_path] = (False, "Invalid file path")
+            continue
+        format_error = _unsupported_format(sanitized)
+        if format_error is not None:
+            results[file_path] = (False, format_error)
+            continue
+        by_directory[os.path.dirname(sanitized)].append((file_path, sanitized))
+
+    for directory, members in by_directory.items():
+        # Scanning a big directory for one file costs more than a stat
+        entries = {}
+        if len(members) > 1:
+            try:
+                with os.scandir(directory) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                pass
+
+        for file_path, sanitized in members:
+            entry = entries.get(os.path.basename(sanitized))
+            try:
+                # Names missing from the scan (single file, unreadable
+                # directory, or a case-only difference) get a plain stat
+                st = entry.stat() if entry is not None else os.stat(sanitized)
+            except OSError as e:
+                results[file_path] = _stat_failure(sanitized, e)[:2]
+                continue
+            results[file_path] = _check_video_stat(sanitized, st)[:2]
+
+    return results
+
+
+def _unsupported_format(file_path: str) -> Optional[str]:
+    """
+    Check a file's extension against the supported input formats.
+
+    Args:
+        file_path: Sanitized path to the file
+
+    Returns:
+        Error message if the format isn't supported, otherwise None
+    """
+    suffix = os.path.splitext(file_path)[1]
+    if suffix.lower() in _SUPPORTED_EXT:
+        return None
+
+    logger.debug("Unsupported file format: %s", suffix)
+    return (f"Unsupported file format: {suffix}\n\n"
+            f"Supported formats: {_SUPPORTED_STR}")
+
+
+def _stat_failure(file_path: str, error: OSError) -> Tuple[bool, str, None]:
+    """
+    Build the check_video_file() result for a file that couldn't be statted.
+
+    Args:
+        file_path: Sanitized path to the file
+        error: Error raised by stat
+
+    Returns:
+        Tuple of (False, error_message, None)
+    """
+    name = os.path.basename(file_path)
+    if isinstance(error, FileNotFoundError):
+        logger.debug("File does not exist: %s", file_path)
+        return False, f"File not found: {name}\n\nThe file may have been moved or deleted.", None
+
+    logger.debug("Cannot stat file: %s (%s)", file_path, error)
+    return False, (f"Cannot read file: {name}\n\n"
+                  "The file may be locked by another program or you don't have permission to read it."), None
 
-    # Check if file exists
-    if not path.exists():
-        logger.warning(f"File does not exist: {file_path}")
-        return False, f"File not found: {path.name}\n\nThe file may have been moved or deleted."
-
-    if not path.is_file():
-        logger.warning(f"Path is not a file: {file_path}")
-        return False, f"Invalid file: {path.name}\n\nThis appears to be a directory, not a file."
-
-    # Check file extension
-    if path.suffix.lower() not in config.SUPPORTED_INPUT_FORMATS:
-        supported = ", ".join(config.SUPPORTED_INPUT_FORMATS)
-        logger.warning(f"Unsupported file format: {path.suffix}")
-        return False, (f"Unsupported file format: {path.suffix}\n\n"
-                      f"Supported formats: {supported}")
-
-    # Check if file is readable
-    if not os.access(file_path, os.R_OK):
-        logger.warning(f"File is not readable: {file_path}")
-        return False, (f"Cannot read file: {path.name}\n\n"
-                      "The file may be locked by another program or you don't have permission to read it.")
 
-    # Check if file has content
-    file_size = path.stat().st_size
-    if file_size == 0:
-        logger.warning(f"File is empty: {file_path}")
-        return False, f"Empty file: {path.name}\n\nThe file has 0 bytes and cannot be converted."
+def _check_video_stat(file_path: str, st: os.stat_result) -> Tuple[bool, str, os.stat_result]:
+    """
+    Run the video file checks that need the file's stat result.
+
+    Args:
+        file_path: Sanitized path to the file
+        st: stat result for file_path
 
-    # Warn if file is very small (likely corrupted)
-    if file_size < 1024:  # Less than 1 KB
-        logger.warning(f"File is suspiciously small: {file_path} ({file_size} bytes)")
+    Returns:
+        Tuple of (is_valid, error_message, st)
+    """
+    path = Path(file_path)
+
+    if not stat.S_ISREG(st.st_mode):
+        logger.debug("Path is not a file: %s", file_path)
+        return False, f"Invalid file: {path.name}\n\nThis appears to be a directory, not a file.", st
+
+    # Check if file is readable by opening it, as FFmpeg will; unlike
+    # os.access this also catches files locked by another program
+    try:
+        os.close(os.open(file_path, os.O_RDONLY))
+    except PermissionError:
+        logger.debug("File is not readable: %s", file_path)
+        return False, (f"Cannot read file: {path.name}\n\n"
+                      "The file may be locked by another program or you don't have permission to read it."), st
+    except OSError as e:
+        logger.debug("Cannot open file: %s (%s)", file_path, e)
+        return False, f"Cannot read file: {path.name}\n\nError: {e}", st
+
+    # Check that the file has content and isn't too small to be a video
+    # (likely corrupted); one comparison on the valid path
+    file_size = st.st_size
+    if file_size < _MIN_FILE_SIZE:
+        if file_size == 0:
+            logger.debug("File is empty: %s", file_path)
+            return False, f"Empty file: {path.name}\n\nThe file has 0 bytes and cannot be converted.", st
+
+        logger.debug("File is suspiciously small: %s (%d bytes)", file_path, file_size)
         return False, (f"File too small: {path.name}\n\n"
                       f"The file is only {file_size} bytes, which is unusually small for a video. "
-                      "It may be corrupted.")
+                      "It may be corrupted."), st
 
-    return True, "Valid video file"
+    return True, "Valid video file", st
 
 
 def check_disk_space(output_directory: str, estimated_size_bytes: int) -> Tuple[bool, str]:
@@ -109,86 +296,169 @@ def check_disk_space(output_directory: str, estimated_size_bytes: int) -> Tuple[
         Tuple of (has_space, message)
     """
     try:
-        stat = shutil.disk_usage(output_directory)
-        available_bytes = stat.free
-
-        # Add 10% buffer for safety
-        required_bytes = int(estimated_size_bytes * 1.1)
-
-        if available_bytes < required_bytes:
-            available_gb = available_bytes / (1024 ** 3)
-            required_gb = required_bytes / (1024 ** 3)
-            message = f"Insufficient disk space. Available: {available_gb:.2f} GB, Required: {required_gb:.2f} GB"
-            logger.error(message)
+        message = _insufficient_space_message(_free_disk_bytes(output_directory),
+                                              estimated_size_bytes)
+        if message is not None:
             return False, message
 
         return True, "Sufficient disk space available"
 
     except Exception as e:
-        logger.error(f"Error checking disk space: {e}")
+        logger.error("Error checking disk space: %s", e)
         return True, "Could not verify disk space (proceeding anyway)"
 
 
-def check_ffmpeg_available() -> Tuple[bool, str]:
+def _free_disk_bytes(directory: str) -> int:
+    """
+    Get the space available to this user on a directory's filesystem.
+
+    Args:
+        directory: Directory on the filesystem to check
+
+    Returns:
+        Free space in bytes
+
+    Raises:
+        OSError: If the filesystem can't be queried
+    """
+    if hasattr(os, 'statvfs'):
+        # POSIX: same figure shutil.disk_usage reports as 'free'
+        st = os.statvfs(directory)
+        return st.f_bavail * st.f_frsize
+    return shutil.disk_usage(directory).free
+
+
+def _insufficient_space_message(available_bytes: int, estimated_size_bytes: int) -> Optional[str]:
+    """
+    Compare free space against an estimated output size plus a safety margin.
+
+    Args:
+        available_bytes: Free space in bytes
+        estimated_size_bytes: Estimated output file size in bytes
+
+    Returns:
+        Error message if there isn't enough space, otherwise None
+    """
+    # Add a buffer for safety
+    required_bytes = int(estimated_size_bytes * config.DISK_SPACE_SAFETY_FACTOR)
+    if available_bytes >= required_bytes:
+        return None
+
+    available_gb = available_bytes / (1024 ** 3)
+    required_gb = required_bytes / (1024 ** 3)
+    message = f"Insufficient disk space. Available: {available_gb:.2f} GB, Required: {required_gb:.2f} GB"
+    logger.error(message)
+    return message
+
+
+def check_ffmpeg_available(refresh: bool = False, deep: bool = False) -> Tuple[bool, str]:
     """
     Check if FFmpeg and ffprobe are available on the system.
 
+    By default this only looks the binaries up on PATH. A successful result
+    is cached per binary pair, so repeat calls are free; a failure is
+    checked again on every call.
+
+    Args:
+        refresh: Check again instead of using the cached result
+        deep: Also run both binaries with -version to check they work
+
     Returns:
         Tuple of (is_available, message)
     """
-    import subprocess
+    if refresh:
+        invalidate_ffmpeg_cache()
 
-    # Check ffmpeg
-    try:
-        result = subprocess.run(
-            [config.FFMPEG_BINARY, '-version'],
-            capture_output=True,
-            timeout=5
-        )
-        if result.returncode != 0:
-            message = "FFmpeg is not working properly"
-            logger.error(message)
-            return False, message
-    except FileNotFoundError:
-        message = "FFmpeg is not installed. Please install FFmpeg to use this application."
-        logger.error(message)
-        return False, message
-    except Exception as e:
-        message = f"Error checking FFmpeg: {e}"
-        logger.error(message)
-        return False, message
+    key = (config.FFMPEG_BINARY, config.FFPROBE_BINARY, deep)
+    result = _ffmpeg_check_cache.get(key)
+    if result is None:
+        result = _check_ffmpeg_binaries(*key)
+        if result[0]:
+            _ffmpeg_check_cache[key] = result
+    return result
 
-    # Check ffprobe
-    try:
-        result = subprocess.run(
-            [config.FFPROBE_BINARY, '-version'],
-            capture_output=True,
-            timeout=5
-        )
-        if result.returncode != 0:
-            message = "ffprobe is not working properly"
-            logger.error(message)
-            return False, message
-    except FileNotFoundError:
-        message = "ffprobe is not installed. Please install FFmpeg (includes ffprobe)."
-        logger.error(message)
-        return False, message
-    except Exception as e:
-        message = f"Error checking ffprobe: {e}"
-        logger.error(message)
-        return False, message
+
+def invalidate_ffmpeg_cache():
+    """Forget cached check_ffmpeg_available() results."""
+    _ffmpeg_check_cache.clear()
+
+
+def _check_ffmpeg_binaries(ffmpeg_bin: str, ffprobe_bin: str, deep: bool) -> Tuple[bool, str]:
+    """
+    Check that ffmpeg and ffprobe exist and, for a deep check, that they run.
+
+    Args:
+        ffmpeg_bin: FFmpeg executable
+        ffprobe_bin: ffprobe executable
+        deep: Run both with -version instead of only finding them on PATH
+
+    Returns:
+        Tuple of (is_available, message)
+    """
+    ffmpeg_missing = "FFmpeg is not installed. Please install FFmpeg to use this application."
+    ffprobe_missing = "ffprobe is not installed. Please install FFmpeg (includes ffprobe)."
+
+    # Finding the executables is a PATH scan; no process is started
+    if shutil.which(ffmpeg_bin) is None:
+        logger.error(ffmpeg_missing)
+        return False, ffmpeg_missing
+    if shutil.which(ffprobe_bin) is None:
+        logger.error(ffprobe_missing)
+        return False, ffprobe_missing
+
+    if deep:
+        # Start both probes before waiting on either so they run concurrently
+        processes = []
+        spawn_error = None
+        for binary, name, missing in ((ffmpeg_bin, "FFmpeg", ffmpeg_missing),
+                                      (ffprobe_bin, "ffprobe", ffprobe_missing)):
+            try:
+                processes.append((name, subprocess.Popen(
+                    [binary, '-version'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )))
+            except FileNotFoundError:
+                spawn_error = missing
+                break
+            except Exception as e:
+                spawn_error = f"Error checking {name}: {e}"
+                break
+
+        # Problems in FFmpeg, ffprobe order; the spawn failure (if any) is
+        # for the binary after the ones that started
+        problems = []
+        for name, process in processes:
+            try:
+                process.wait(timeout=5)
+            except Exception as e:
+                process.kill()
+                process.wait()
+                problems.append(f"Error checking {name}: {e}")
+                continue
+            if process.returncode != 0:
+                problems.append(f"{name} is not working properly")
+        if spawn_error is not None:
+            problems.append(spawn_error)
+
+        if problems:
+            logger.error(problems[0])
+            return False, problems[0]
 
     logger.info("FFmpeg and ffprobe are available")
     return True, "FFmpeg and ffprobe are available"
 
 
-def get_output_filename(input_path: str, output_directory: str = None) -> str:
+def get_output_filename(input_path: str, output_directory: str = None,
+                        exclude: Set[str] = frozenset()) -> str:
     """
     Generate output filename for converted video.
 
     Args:
         input_path: Input file path
         output_directory: Output directory. Uses config default if None.
+        exclude: Output paths to treat as taken even if they don't exist yet
+                 (e.g. reserved by other files in the same batch)
 
     Returns:
         Full path to output file
@@ -198,8 +468,44 @@ def get_output_filename(input_path: str, output_directory: str = None) -> str:
     if output_directory:
         output_directory = sanitize_path(output_directory)
 
+    output_dir = output_directory or config.get_output_directory()
+    return _pick_output_path(input_path, output_dir, _list_directory_names(output_dir), exclude)
+
+
+def _list_directory_names(directory: str) -> Set[str]:
+    """
+    Read the names in a directory in one scan.
+
+    Args:
+        directory: Directory to read
+
+    Returns:
+        Set of entry names (empty if the directory can't be read)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _pick_output_path(input_path: str, output_directory: str, existing: Set[str],
+                      exclude: Set[str]) -> str:
+    """
+    Choose a free output path, checking candidates against a directory listing.
+
+    Args:
+        input_path: Sanitized input file path
+        output_directory: Output directory
+        existing: Names already in output_directory; updated if a pick turns
+                  out to be taken
+        exclude: Output paths to treat as taken even if they don't exist yet
+
+    Returns:
+        Full path to output file
+    """
     input_file = Path(input_path)
-    output_dir = Path(output_directory or config.get_output_directory())
+    output_dir = Path(output_directory)
 
     # Create output filename: input_name + .mov
     output_name = input_file.stem + config.OUTPUT_FORMAT
@@ -207,7 +513,13 @@ def get_output_filename(input_path: str, output_directory: str = None) -> str:
 
     # If file exists, add number suffix
     counter = 1
-    while output_path.exists():
+    while True:
+        if output_name not in existing and str(output_path) not in exclude:
+            # Confirm the pick on disk; this also catches names that only
+            # differ in case on case-insensitive filesystems
+            if not output_path.exists():
+                break
+            existing.add(output_name)
         output_name = f"{input_file.stem}_{counter}{config.OUTPUT_FORMAT}"
         output_path = output_dir / output_name
         counter += 1
@@ -226,81 +538,154 @@ def validate_conversion_request(input_file: str, output_directory: str = None) -
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Check if input file is valid
-    is_valid, message = is_valid_video_file(input_file)
-    if not is_valid:
-        return False, message
+    # Cheapest checks first: the FFmpeg check is cached after the first
+    # call, and check_video_file() tests the extension before any stat
+    if not input_file:
+        return False, "No file path provided"
 
     # Check FFmpeg availability
     ffmpeg_available, message = check_ffmpeg_available()
     if not ffmpeg_available:
         return False, message
 
+    # Check if input file is valid
+    is_valid, message, _ = check_video_file(input_file)
+    if not is_valid:
+        return False, message
+
     # Check output directory
     output_dir = output_directory or config.get_output_directory()
-    output_path = Path(output_dir)
+    message = _check_output_directory(output_dir)
+    if message is not None:
+        return False, message
+
+    return True, "Validation successful"
+
 
-    # Create directory if it doesn't exist
+def _check_output_directory(output_dir: str) -> Optional[str]:
+    """
+    Make sure the output directory exists and is writable, creating it if needed.
+
+    Args:
+        output_dir: Output directory
+
+    Returns:
+        Error message if the directory can't be used, otherwise None
+    """
+    # Create directory if it doesn't exist; usually it does, and one stat
+    # is enough to tell
     try:
-        output_path.mkdir(parents=True, exist_ok=True)
-    except PermissionError:
-        return False, (f"Permission denied creating output directory:\n{output_dir}\n\n"
-                      "Please choose a different location or run with appropriate permissions.")
-    except Exception as e:
-        return False, f"Cannot create output directory:\n{output_dir}\n\nError: {e}"
+        if not stat.S_ISDIR(os.stat(output_dir).st_mode):
+            return (f"Output path is not a directory:\n{output_dir}\n\n"
+                    "Please choose a different location.")
+    except FileNotFoundError:
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except PermissionError:
+            return (f"Permission denied creating output directory:\n{output_dir}\n\n"
+                    "Please choose a different location or run with appropriate permissions.")
+        except Exception as e:
+            return f"Cannot create output directory:\n{output_dir}\n\nError: {e}"
+    except OSError as e:
+        return f"Cannot access output directory:\n{output_dir}\n\nError: {e}"
 
     # Check if output directory is writable
     if not os.access(output_dir, os.W_OK):
-        return False, (f"Output directory is not writable:\n{output_dir}\n\n"
-                      "Please choose a different location or check folder permissions.")
+        return (f"Output directory is not writable:\n{output_dir}\n\n"
+                "Please choose a different location or check folder permissions.")
 
-    return True, "Validation successful"
+    return None
 
 
-def parse_ffmpeg_error(error_output: str) -> str:
+@dataclass
+class ConversionPlan:
+    """Everything prepare_conversion() found out about one conversion."""
+
+    ok: bool
+    message: str
+    input_stat: Optional[os.stat_result] = None
+    output_path: Optional[str] = None
+    free_bytes: Optional[int] = None
+    estimated_bytes: int = 0  # Output size the free-space check assumed
+
+
+def prepare_conversion(input_path: str, output_directory: str = None,
+                       exclude: Set[str] = frozenset(),
+                       reserved_bytes: int = 0) -> ConversionPlan:
     """
-    Parse FFmpeg error output and provide user-friendly error messages.
+    Validate a conversion and choose its output path in one filesystem visit.
+
+    Does one stat of the input, one scan of the output directory (used to
+    pick a free output name) and one free-space query.
 
     Args:
-        error_output: FFmpeg error output
+        input_path: Input video file path
+        output_directory: Output directory. Uses config default if None.
+        exclude: Output paths to treat as taken even if they don't exist yet
+                 (e.g. reserved by other files in the same batch)
+        reserved_bytes: Space promised to outputs that are still being
+                        written (e.g. by concurrent files in the same batch),
+                        subtracted from the free space
 
     Returns:
-        User-friendly error message
+        ConversionPlan; output_path is set whenever the output directory
+        is usable, and ok is False with a message if conversion can't go ahead
     """
-    error_lower = error_output.lower()
+    is_valid, message, input_stat = check_video_file(input_path)
+    if not is_valid:
+        return ConversionPlan(False, message, input_stat)
+
+    if output_directory:
+        output_directory = sanitize_path(output_directory)
+    output_dir = output_directory or config.get_output_directory()
+
+    message = _check_output_directory(output_dir)
+    if message is not None:
+        return ConversionPlan(False, message, input_stat)
 
-    # Common FFmpeg errors with helpful messages
-    if "no such file or directory" in error_lower:
-        return ("File not found.\n\n"
-                "The input file may have been moved or deleted during conversion.")
+    output_path = _pick_output_path(sanitize_path(input_path), output_dir,
+                                    _list_directory_names(output_dir), exclude)
 
-    if "permission denied" in error_lower:
-        return ("Permission denied.\n\n"
-                "The file may be locked by another program or you don't have permission to access it.")
+    # The all-intra (-g 1) output is normally larger than the input, so
+    # the input size is a lower bound for what the output needs
+    estimated_bytes = input_stat.st_size
 
-    if "invalid data" in error_lower or "invalid argument" in error_lower:
-        return ("Invalid or corrupted video file.\n\n"
-                "The file may be damaged or in an unsupported format.")
+    try:
+        free_bytes = _free_disk_bytes(output_dir)
+    except OSError as e:
+        logger.debug("Could not check free space in %s: %s", output_dir, e)
+        return ConversionPlan(True, "Ready to convert", input_stat, output_path,
+                              estimated_bytes=estimated_bytes)
+
+    # Outputs still being written only partly show up in free_bytes so far;
+    # counting their whole estimate errs on the safe side
+    available_bytes = max(0, free_bytes - reserved_bytes)
+    message = _insufficient_space_message(available_bytes, estimated_bytes)
+    if message is not None:
+        return ConversionPlan(False, message, input_stat, output_path, free_bytes,
+                              estimated_bytes)
 
-    if "codec not found" in error_lower or "unknown encoder" in error_lower:
-        return ("Required video codec not available.\n\n"
-                "Your FFmpeg installation may be missing required codecs.")
+    return ConversionPlan(True, "Ready to convert", input_stat, output_path, free_bytes,
+                          estimated_bytes)
 
-    if "disk full" in error_lower or "no space left" in error_lower:
-        return ("Not enough disk space.\n\n"
-                "Free up some disk space and try again.")
 
-    if "out of memory" in error_lower or "cannot allocate memory" in error_lower:
-        return ("Out of memory.\n\n"
-                "Close some applications and try again.")
+def parse_ffmpeg_error(error_output: str) -> str:
+    """
+    Parse FFmpeg error output and provide user-friendly error messages.
 
-    if "could not open" in error_lower and "output" in error_lower:
-        return ("Cannot create output file.\n\n"
-                "Check that the output directory is writable and has enough space.")
+    Args:
+        error_output: FFmpeg error output
 
-    if "timeout" in error_lower:
-        return ("Conversion timeout.\n\n"
-                "The file may be too large or complex to convert.")
+    Returns:
+        User-friendly error message
+    """
+    # Common FFmpeg errors with helpful messages. Every match is collected
+    # so a higher-priority error wins even if it appears later in the output.
+    found = {match.lastindex for match in _FFMPEG_ERROR_RE.finditer(error_output)}
+    if found:
+        for groups, message in _FFMPEG_ERROR_MESSAGES:
+            if groups <= found:
+                return message
 
     # If no specific error matched, return a generic helpful message
     return ("Video conversion failed.\n\n"